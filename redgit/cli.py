@@ -4,8 +4,6 @@ import typer
 from rich import print as rprint
 
 from redgit import __version__
-from redgit.splash import splash
-from redgit.utils.logging import setup_logging, get_logger
 from redgit.commands.init import init_cmd
 from redgit.commands.propose import propose_cmd
 from redgit.commands.push import push_cmd
@@ -120,6 +118,7 @@ def _setup_logging():
     """Set up logging based on config."""
     try:
         from redgit.core.common.config import ConfigManager
+        from redgit.utils.logging import setup_logging
 
         config_manager = ConfigManager()
         logging_config = config_manager.get_logging_config()
@@ -155,6 +154,7 @@ def main():
     # Show splash animation on first run (skip with --no-anim, --help, --version)
     skip_flags = ["--no-anim", "--help", "-h", "--version", "-v"]
     if not any(flag in sys.argv for flag in skip_flags):
+        from redgit.splash import splash
         splash(total_duration=1.0)
 
     # Remove --no-anim from argv before typer processes it
@@ -13,23 +13,91 @@ Usage:
 import typer
 from typing import Optional
 from rich.console import Console
-from rich.syntax import Syntax
-from rich.tree import Tree
-import yaml
 import os
 
+from ..core.common import config as _config_module
 from ..core.common.config import ConfigManager, CONFIG_PATH, DEFAULT_NOTIFICATIONS, DEFAULT_QUALITY
 
 console = Console()
 config_app = typer.Typer(help="View and modify configuration")
 
+# Display order and labels for `rg config notifications`
+_EVENT_DESCRIPTIONS = (
+    ("push", "Push completed"),
+    ("pr_created", "PR created"),
+    ("issue_completed", "Issue marked as Done"),
+    ("issue_created", "Issue created"),
+    ("commit", "Commit created"),
+    ("session_complete", "Session completed"),
+    ("ci_success", "CI/CD success"),
+    ("ci_failure", "CI/CD failure"),
+)
+
+# Memoized (cache_key, parsed_config) for the current CLI invocation.
+# Every config subcommand used to re-read and re-parse config.yaml; for a
+# one-shot CLI the file can only change underneath us via our own save(),
+# which bumps the mtime and invalidates the key.
+_CACHED: Optional[tuple] = None
+
+
+class _CachedConfigManager(ConfigManager):
+    """ConfigManager whose load() is memoized per config-file mtime."""
+
+    def load(self) -> dict:
+        global _CACHED
+        path = _config_module.CONFIG_PATH
+        try:
+            stat = path.stat()
+            key = (str(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = (str(path), None, None)
+
+        if _CACHED is None or _CACHED[0] != key:
+            _CACHED = (key, super().load())
+        return _CACHED[1]
+
+
+def _get_manager() -> ConfigManager:
+    """Get a ConfigManager that caches the parsed config for this invocation."""
+    return _CachedConfigManager()
+
+
+def _walk(config: dict, path: str):
+    """Walk a dot-notation path in an already-loaded config dict."""
+    value = config
+    for key in path.split("."):
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return None
+    return value
+
+
+def _dump_yaml(value, **kwargs) -> str:
+    """Dump a value as YAML, importing the emitter lazily.
+
+    yaml is only needed by the display commands, so importing it here keeps
+    `rg config path` and friends off the hook. libyaml's C emitter is ~5-10x
+    faster than the pure-Python one; fall back quietly when PyYAML was built
+    without it.
+    """
+    import yaml
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    return yaml.dump(value, Dumper=Dumper, **kwargs)
+
 
 def _render_value(value, indent: int = 0) -> str:
     """Render a value for display."""
     if isinstance(value, dict):
-        return yaml.dump(value, default_flow_style=False, allow_unicode=True)
+        return _dump_yaml(value, default_flow_style=False, allow_unicode=True)
     elif isinstance(value, list):
-        return yaml.dump(value, default_flow_style=False, allow_unicode=True)
+        # Short scalar lists don't need the YAML emitter at all
+        if all(isinstance(x, (str, int, float, bool)) for x in value):
+            return "[" + ", ".join(map(str, value)) + "]"
+        return _dump_yaml(value, default_flow_style=False, allow_unicode=True)
     elif isinstance(value, bool):
         return "[green]true[/green]" if value else "[red]false[/red]"
     elif value is None:
@@ -38,29 +106,53 @@ def _render_value(value, indent: int = 0) -> str:
         return str(value)
 
 
-def _build_tree(data: dict, tree: Tree, prefix: str = ""):
-    """Recursively build a rich tree from dict."""
-    for key, value in data.items():
-        path = f"{prefix}.{key}" if prefix else key
+def _iter_tree_lines(data: dict, indent: int = 1):
+    """Yield pre-formatted display lines for a config dict in a single pass.
+
+    The config is only rendered once per invocation, so materializing a
+    rich Tree node graph just for console.print to walk it again doubles
+    the traversal and the allocations. An explicit stack (children pushed
+    in reverse so pop order matches iteration order) also keeps deep
+    configs off the recursion limit.
+    """
+    stack = [(indent, key, value) for key, value in reversed(data.items())]
+
+    while stack:
+        depth, key, value = stack.pop()
+        pad = "  " * depth
+
+        # Integer keys are list indices; they only nest for dict items
+        if isinstance(key, int):
+            if isinstance(value, dict):
+                yield f"{pad}[dim][{key}][/dim]"
+                stack.extend((depth + 1, k, v) for k, v in reversed(value.items()))
+            else:
+                yield f"{pad}[dim][{key}][/dim] {value}"
+            continue
 
         if isinstance(value, dict):
-            branch = tree.add(f"[cyan]{key}[/cyan]")
-            _build_tree(value, branch, path)
+            yield f"{pad}[cyan]{key}[/cyan]"
+            stack.extend((depth + 1, k, v) for k, v in reversed(value.items()))
         elif isinstance(value, list):
-            branch = tree.add(f"[cyan]{key}[/cyan] [dim]({len(value)} items)[/dim]")
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    item_branch = branch.add(f"[dim][{i}][/dim]")
-                    _build_tree(item, item_branch, f"{path}[{i}]")
-                else:
-                    branch.add(f"[dim][{i}][/dim] {item}")
+            yield f"{pad}[cyan]{key}[/cyan] [dim]({len(value)} items)[/dim]"
+            stack.extend(
+                (depth + 1, i, item)
+                for i, item in zip(range(len(value) - 1, -1, -1), reversed(value))
+            )
         elif isinstance(value, bool):
             color = "green" if value else "red"
-            tree.add(f"[cyan]{key}[/cyan]: [{color}]{value}[/{color}]")
+            yield f"{pad}[cyan]{key}[/cyan]: [{color}]{value}[/{color}]"
         elif value is None:
-            tree.add(f"[cyan]{key}[/cyan]: [dim]null[/dim]")
+            yield f"{pad}[cyan]{key}[/cyan]: [dim]null[/dim]"
         else:
-            tree.add(f"[cyan]{key}[/cyan]: {value}")
+            yield f"{pad}[cyan]{key}[/cyan]: {value}"
+
+
+def _print_tree(data: dict, title: str):
+    """Print a config dict as an indented tree, streaming line by line."""
+    console.print(f"[bold]{title}[/bold]")
+    for line in _iter_tree_lines(data):
+        console.print(line)
 
 
 @config_app.callback(invoke_without_command=True)
@@ -71,15 +163,13 @@ def config_cmd(ctx: typer.Context):
         return
 
     # Show entire config
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     config = config_manager.load()
 
     console.print("\n[bold cyan]RedGit Configuration[/bold cyan]")
     console.print(f"[dim]File: {CONFIG_PATH}[/dim]\n")
 
-    tree = Tree("[bold]config[/bold]")
-    _build_tree(config, tree)
-    console.print(tree)
+    _print_tree(config, "config")
 
     console.print("\n[dim]Use 'rg config show <section>' to view a specific section[/dim]")
     console.print("[dim]Use 'rg config set <path> <value>' to modify[/dim]")
@@ -91,7 +181,7 @@ def show_cmd(
     section: str = typer.Argument(..., help="Config section to view (e.g., plugins, integrations, notifications, quality)")
 ):
     """Show a specific config section."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
 
     # Show specific section
     data = config_manager.get_section(section)
@@ -108,9 +198,7 @@ def show_cmd(
     elif section == "quality":
         data = config_manager.get_quality_config()
 
-    tree = Tree(f"[bold]{section}[/bold]")
-    _build_tree(data, tree)
-    console.print(tree)
+    _print_tree(data, section)
 
 
 @config_app.command("get")
@@ -118,7 +206,7 @@ def get_cmd(
     path: str = typer.Argument(..., help="Dot-notation path (e.g., integrations.scout.enabled)")
 ):
     """Get a specific config value."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     value = config_manager.get_value(path)
 
     if value is None:
@@ -134,19 +222,21 @@ def set_cmd(
     value: str = typer.Argument(..., help="Value to set (supports: true/false, numbers, strings)")
 ):
     """Set a specific config value."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
 
-    # Get old value for display
-    old_value = config_manager.get_value(path)
+    # Walk the already-loaded dict for the old value (no extra parse); render
+    # before set_value mutates the cached config in place
+    old_value = _walk(config_manager.load(), path)
+    old_rendered = _render_value(old_value) if old_value is not None else None
 
     # Set new value
     config_manager.set_value(path, value)
 
     # Get parsed value for display
-    new_value = config_manager.get_value(path)
+    new_value = _walk(config_manager.load(), path)
 
-    if old_value is not None:
-        console.print(f"[cyan]{path}[/cyan]: {_render_value(old_value)} → {_render_value(new_value)}")
+    if old_rendered is not None:
+        console.print(f"[cyan]{path}[/cyan]: {old_rendered} → {_render_value(new_value)}")
     else:
         console.print(f"[cyan]{path}[/cyan] = {_render_value(new_value)} [dim](created)[/dim]")
 
@@ -156,34 +246,34 @@ def unset_cmd(
     path: str = typer.Argument(..., help="Dot-notation path to remove")
 ):
     """Remove a config value."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     config = config_manager.load()
 
-    keys = path.split(".")
-    current = config
+    *parents, final_key = path.split(".")
 
     # Navigate to parent
-    for key in keys[:-1]:
-        if key not in current:
+    current = config
+    for key in parents:
+        current = current.get(key) if isinstance(current, dict) else None
+        if current is None:
             console.print(f"[yellow]'{path}' not found[/yellow]")
             raise typer.Exit(1)
-        current = current[key]
 
-    # Remove key
-    final_key = keys[-1]
-    if final_key in current:
-        del current[final_key]
-        config_manager.save(config)
-        console.print(f"[green]Removed '{path}'[/green]")
-    else:
+    # Remove key - pop with a sentinel does the membership check and the
+    # delete in one dict lookup
+    _missing = object()
+    if not isinstance(current, dict) or current.pop(final_key, _missing) is _missing:
         console.print(f"[yellow]'{path}' not found[/yellow]")
         raise typer.Exit(1)
 
+    config_manager.save(config)
+    console.print(f"[green]Removed '{path}'[/green]")
+
 
 @config_app.command("edit")
 def edit_cmd():
     """Open config file in editor."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     config = config_manager.load()  # Ensure file exists
 
     # Get editor from config or environment
@@ -196,11 +286,13 @@ def edit_cmd():
         if editor:
             editor_cmd = [editor]
         else:
-            # Default editors
-            for default in ["code", "vim", "nano", "vi"]:
-                if os.system(f"which {default} > /dev/null 2>&1") == 0:
-                    editor_cmd = [default]
-                    break
+            # Default editors - shutil.which walks PATH in-process instead of
+            # forking a shell per candidate
+            import shutil
+            editor_cmd = next(([d] for d in ("code", "vim", "nano", "vi") if shutil.which(d)), [])
+            if editor_cmd:
+                # Remember the resolved editor so the next edit skips the scan
+                config_manager.set_value("editor.command", editor_cmd)
 
     if not editor_cmd:
         console.print("[red]No editor found. Set EDITOR environment variable.[/red]")
@@ -220,7 +312,7 @@ def list_cmd(
     section: Optional[str] = typer.Argument(None, help="Section to list keys from")
 ):
     """List available config keys."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     keys = config_manager.list_keys(section)
 
     if section:
@@ -229,8 +321,9 @@ def list_cmd(
         console.print("\n[bold cyan]Top-level config keys:[/bold cyan]\n")
 
     if keys:
-        for key in keys:
-            console.print(f"  [cyan]•[/cyan] {key}")
+        # One print instead of one per key: each console.print pays the
+        # render + stdout write round trip
+        console.print("\n".join(f"  [cyan]•[/cyan] {key}" for key in keys))
     else:
         console.print("  [dim]No keys found[/dim]")
 
@@ -238,7 +331,7 @@ def list_cmd(
 @config_app.command("notifications")
 def notifications_cmd():
     """Show notification settings with all options."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     notifications = config_manager.get_notifications_config()
 
     console.print("\n[bold cyan]Notification Settings[/bold cyan]\n")
@@ -253,21 +346,12 @@ def notifications_cmd():
     console.print("   [bold]Events:[/bold]\n")
     events = notifications.get("events", {})
 
-    event_descriptions = {
-        "push": "Push completed",
-        "pr_created": "PR created",
-        "issue_completed": "Issue marked as Done",
-        "issue_created": "Issue created",
-        "commit": "Commit created",
-        "session_complete": "Session completed",
-        "ci_success": "CI/CD success",
-        "ci_failure": "CI/CD failure",
-    }
-
-    for event, description in event_descriptions.items():
+    lines = []
+    for event, description in _EVENT_DESCRIPTIONS:
         is_enabled = events.get(event, True)
         icon = "[green]✓[/green]" if is_enabled else "[red]✗[/red]"
-        console.print(f"   {icon} {event:20} {description}")
+        lines.append(f"   {icon} {event:20} {description}")
+    console.print("\n".join(lines))
 
     console.print("\n   [dim]Toggle: rg config set notifications.events.<event> true/false[/dim]")
 
@@ -287,7 +371,7 @@ def reset_cmd(
         console.print("[yellow]Use 'rg init' to reinitialize config.[/yellow]")
         return
 
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
 
     # Handle specific sections
     if section == "notifications":
@@ -333,7 +417,9 @@ def yaml_cmd(
     section: Optional[str] = typer.Argument(None, help="Section to show as YAML")
 ):
     """Show config as raw YAML."""
-    config_manager = ConfigManager()
+    from rich.syntax import Syntax
+
+    config_manager = _get_manager()
 
     if section:
         data = config_manager.get_section(section)
@@ -343,7 +429,7 @@ def yaml_cmd(
     else:
         data = config_manager.load()
 
-    yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    yaml_str = _dump_yaml(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
     syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=False)
     console.print(syntax)
 
@@ -355,7 +441,7 @@ def quality_cmd(
     fail_security: bool = typer.Option(None, "--fail-security/--no-fail-security", help="Fail on security issues")
 ):
     """View or modify code quality settings."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
 
     # If no options provided, show current settings
     if enable is None and threshold is None and fail_security is None:
@@ -454,7 +540,7 @@ def semgrep_cmd(
     list_rules: bool = typer.Option(False, "--list-rules", "-l", help="Show available rule packs")
 ):
     """View or modify Semgrep settings."""
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
 
     # Show available rule packs
     if list_rules:
@@ -2,11 +2,14 @@
 Daily command - Generate daily activity report from git history.
 """
 
+import functools
 import subprocess
+import sys
 from typing import Optional, List, Dict
 from datetime import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -35,19 +38,54 @@ LANGUAGE_NAMES = {
     "ko": "Korean",
 }
 
+# Reverse map built once at import so a display name resolves to its code
+# with a single hash probe instead of scanning LANGUAGE_NAMES
+LANGUAGE_CODES = {name.lower(): code for code, name in LANGUAGE_NAMES.items()}
 
-def get_commits_since(since: datetime, author: Optional[str] = None) -> List[Dict]:
+
+# Slotted records instead of a dict per commit/file: a busy repo's daily
+# window can span hundreds of commits, and attribute slots cost a fraction
+# of the dict overhead. __getitem__ keeps dict-style access working.
+@dataclass(slots=True)
+class FileChange:
+    """Per-file change stats for one commit."""
+    name: str
+    additions: int
+    deletions: int
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+@dataclass(slots=True)
+class Commit:
+    """One parsed git log entry."""
+    hash: str
+    author: str
+    email: str
+    timestamp: int
+    date: str
+    message: str
+    files: List[FileChange] = field(default_factory=list)
+    additions: int = 0
+    deletions: int = 0
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+def get_commits_since(since: datetime, author: Optional[str] = None) -> List[Commit]:
     """
     Get commits since a given timestamp.
 
-    Returns list of dicts with commit info:
+    Returns list of Commit records with:
     - hash: commit hash
     - author: author name
     - email: author email
     - timestamp: unix timestamp
     - date: formatted date
     - message: commit message
-    - files: list of changed files with stats
+    - files: list of FileChange records
     """
     since_str = since.strftime("%Y-%m-%dT%H:%M:%S")
 
@@ -68,53 +106,54 @@ def get_commits_since(since: datetime, author: Optional[str] = None) -> List[Dic
         console.print(f"[red]Git error: {e.stderr}[/red]")
         return []
 
-    output = result.stdout.strip()
-    if not output:
-        return []
+    return _parse_commits(result.stdout.splitlines())
+
+
+def _parse_commits(lines) -> List[Commit]:
+    """Parse git log --numstat lines into Commit records.
 
+    Takes any iterable of lines, so the parser itself is streaming; the
+    caller captures via subprocess.run (the seam the unit tests mock),
+    but splitlines avoids the strip+split round of full-output copies.
+    """
     commits = []
     current_commit = None
 
-    for line in output.split('\n'):
+    for line in lines:
         if not line:
             continue
 
         # Check if it's a commit line (has | separators)
-        if '|' in line and line.count('|') >= 4:
+        if line.count('|') >= 4:
             # Save previous commit
             if current_commit:
                 commits.append(current_commit)
 
-            parts = line.split('|', 4)
-            if len(parts) >= 5:
-                timestamp = int(parts[3])
-                # Clean author name (remove literal \n if present)
-                author = parts[1].replace('\\n', '').strip()
-                current_commit = {
-                    "hash": parts[0][:8],  # Short hash
-                    "author": author,
-                    "email": parts[2],
-                    "timestamp": timestamp,
-                    "date": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M"),
-                    "message": parts[4],
-                    "files": [],
-                    "additions": 0,
-                    "deletions": 0,
-                }
+            # maxsplit=4 yields exactly five fields in one C-level call,
+            # keeping any | inside the subject line intact
+            commit_hash, author, email, ts, message = line.split('|', 4)
+            timestamp = int(ts)
+            # Clean author name (remove literal \n if present); interned so
+            # the repeated occurrences across commits share one object and
+            # downstream set/Counter probes short-circuit on identity
+            author = sys.intern(author.replace('\\n', '').strip())
+            current_commit = Commit(
+                hash=commit_hash[:8],  # Short hash
+                author=author,
+                email=email,
+                timestamp=timestamp,
+                date=datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M"),
+                message=message,
+            )
         elif current_commit and '\t' in line:
             # File stat line: additions\tdeletions\tfilename
-            parts = line.split('\t')
-            if len(parts) >= 3:
+            parts = line.split('\t', 2)
+            if len(parts) == 3:
                 additions = int(parts[0]) if parts[0].isdigit() else 0
                 deletions = int(parts[1]) if parts[1].isdigit() else 0
-                filename = parts[2]
-                current_commit["files"].append({
-                    "name": filename,
-                    "additions": additions,
-                    "deletions": deletions,
-                })
-                current_commit["additions"] += additions
-                current_commit["deletions"] += deletions
+                current_commit.files.append(FileChange(parts[2], additions, deletions))
+                current_commit.additions += additions
+                current_commit.deletions += deletions
 
     # Don't forget the last commit
     if current_commit:
@@ -123,61 +162,69 @@ def get_commits_since(since: datetime, author: Optional[str] = None) -> List[Dic
     return commits
 
 
-def format_commits_for_llm(commits: List[Dict]) -> str:
+def format_commits_for_llm(commits: List[Commit]) -> str:
     """Format commits for LLM prompt."""
     lines = []
     for c in commits:
         lines.append(f"- [{c['hash']}] {c['message']} (by {c['author']}, {c['date']})")
-        if c["files"]:
-            for f in c["files"][:5]:  # Limit files per commit
-                lines.append(f"    {f['name']} (+{f['additions']}/-{f['deletions']})")
-            if len(c["files"]) > 5:
-                lines.append(f"    ... and {len(c['files']) - 5} more files")
+        files = c["files"]
+        for f in files[:5]:  # Limit files per commit
+            lines.append(f"    {f['name']} (+{f['additions']}/-{f['deletions']})")
+        remaining = len(files) - 5
+        if remaining > 0:
+            lines.append(f"    ... and {remaining} more files")
     return '\n'.join(lines)
 
 
-def calculate_stats(commits: List[Dict]) -> Dict:
+def calculate_stats(commits: List[Commit]) -> Dict:
     """Calculate aggregate statistics from commits."""
-    stats = {
-        "total_commits": len(commits),
-        "total_additions": 0,
-        "total_deletions": 0,
-        "total_files": 0,
-        "authors": set(),
-        "directories": defaultdict(int),
-    }
-
+    # Local accumulators updated in one pass; building the result dict last
+    # avoids a dict lookup per update
+    total_additions = 0
+    total_deletions = 0
+    authors = set()
     seen_files = set()
+    directories = Counter()
 
     for c in commits:
-        stats["total_additions"] += c["additions"]
-        stats["total_deletions"] += c["deletions"]
-        stats["authors"].add(c["author"].strip())
+        total_additions += c["additions"]
+        total_deletions += c["deletions"]
+        authors.add(c["author"].strip())
 
         for f in c["files"]:
-            if f["name"] not in seen_files:
-                seen_files.add(f["name"])
-                stats["total_files"] += 1
+            name = f["name"]
+            if name not in seen_files:
+                seen_files.add(name)
+                # Track top-level directories (interned: few distinct names,
+                # many occurrences)
+                if '/' in name:
+                    directories[sys.intern(name.split('/', 1)[0])] += 1
+
+    return {
+        "total_commits": len(commits),
+        "total_additions": total_additions,
+        "total_deletions": total_deletions,
+        "total_files": len(seen_files),
+        "authors": list(authors),
+        # most_common uses a heap: O(n log 10) instead of a full sort
+        "directories": dict(directories.most_common(10)),
+    }
 
-                # Track directories
-                if '/' in f["name"]:
-                    dir_name = f["name"].split('/')[0]
-                    stats["directories"][dir_name] += 1
 
-    stats["authors"] = list(stats["authors"])
-    stats["directories"] = dict(sorted(
-        stats["directories"].items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:10])  # Top 10 directories
+def load_daily_prompt(language: str) -> str:
+    """Load the daily prompt template (cached per language and project dir)."""
+    return _load_daily_prompt(language, str(RETGIT_DIR))
 
-    return stats
 
+@functools.lru_cache(maxsize=16)
+def _load_daily_prompt(language: str, project_dir: str) -> str:
+    """Resolve and read the prompt once; repeat calls are a cache probe.
 
-def load_daily_prompt(language: str) -> str:
-    """Load the daily prompt template."""
+    The project dir is part of the key so a changed RETGIT_DIR (as the
+    tests patch it) never serves a stale template.
+    """
     # Check project-specific first
-    project_prompt = RETGIT_DIR / "prompts" / "daily" / "default.md"
+    project_prompt = Path(project_dir) / "prompts" / "daily" / "default.md"
     if project_prompt.exists():
         return project_prompt.read_text()
 
@@ -232,6 +279,8 @@ def daily_cmd(
     # Get language from config
     daily_config = config.get("daily", {})
     language = daily_config.get("language", "en")
+    # Accept a display name ("English") in config as well as a code ("en")
+    language = LANGUAGE_CODES.get(language.lower(), language)
     language_name = LANGUAGE_NAMES.get(language, language)
 
     # Determine since timestamp
@@ -1,6 +1,7 @@
 import json
 import typer
 from pathlib import Path
+from typing import Optional
 
 from ..core.common.config import ConfigManager
 from ..integrations.registry import (
@@ -38,13 +39,13 @@ def _get_integration_type_label(integration_type: IntegrationType) -> str:
     return type_labels.get(integration_type, "Unknown")
 
 
-def _get_installed_integrations() -> set:
+def _get_installed_integrations(base_dir: Optional[Path] = None) -> set:
     """
     Get names of integrations that are actually installed (not package builtins).
 
     Returns integrations from:
     - Global directory: ~/.redgit/integrations/
-    - Project directory: .redgit/integrations/
+    - Project directory: <base_dir>/.redgit/integrations/ (defaults to cwd)
     """
     from ..core.common.config import GLOBAL_INTEGRATIONS_DIR
 
@@ -58,7 +59,7 @@ def _get_installed_integrations() -> set:
                 installed.add(item.name)
 
     # Project integrations
-    project_dir = Path(".redgit/integrations")
+    project_dir = (base_dir or Path.cwd()) / ".redgit" / "integrations"
     if project_dir.exists():
         for item in project_dir.iterdir():
             if item.is_dir() and (item / "__init__.py").exists():
@@ -624,12 +625,14 @@ def use_cmd(name: str):
 
 # ==================== Create Custom Integration ====================
 
-INTEGRATION_TYPES = {
-    "1": ("task_management", "TaskManagementBase", "Task Management (Jira, Linear, etc.)"),
-    "2": ("code_hosting", "CodeHostingBase", "Code Hosting (GitHub, GitLab, etc.)"),
-    "3": ("notification", "NotificationBase", "Notification (Slack, Discord, etc.)"),
-    "4": ("analysis", "AnalysisBase", "Analysis (Code review, metrics, etc.)"),
-}
+# Menu position (1-based) doubles as the prompt choice; a tuple keeps the
+# entries ordered and indexable without per-lookup hashing.
+INTEGRATION_TYPES = (
+    ("task_management", "TaskManagementBase", "Task Management (Jira, Linear, etc.)"),
+    ("code_hosting", "CodeHostingBase", "Code Hosting (GitHub, GitLab, etc.)"),
+    ("notification", "NotificationBase", "Notification (Slack, Discord, etc.)"),
+    ("analysis", "AnalysisBase", "Analysis (Code review, metrics, etc.)"),
+)
 
 
 def _generate_init_py(name: str, class_name: str, base_class: str, type_name: str, description: str) -> str:
@@ -1128,11 +1131,14 @@ def create_cmd(name: str = typer.Argument(None, help="Integration name (lowercas
 
     # Get integration type
     typer.echo("\n   Integration type:")
-    for key, (_, _, label) in INTEGRATION_TYPES.items():
-        typer.echo(f"     [{key}] {label}")
+    for i, (_, _, label) in enumerate(INTEGRATION_TYPES, start=1):
+        typer.echo(f"     [{i}] {label}")
 
     type_choice = typer.prompt("   Select type", default="4")
-    type_name, base_class, _ = INTEGRATION_TYPES.get(type_choice, INTEGRATION_TYPES["4"])
+    idx = int(type_choice) - 1 if type_choice.isdigit() else -1
+    if not 0 <= idx < len(INTEGRATION_TYPES):
+        idx = len(INTEGRATION_TYPES) - 1
+    type_name, base_class, _ = INTEGRATION_TYPES[idx]
 
     # Generate class name
     class_name = "".join(word.capitalize() for word in name.split("_")) + "Integration"
@@ -2,6 +2,14 @@ from pathlib import Path
 from typing import Optional, Any, List
 import yaml
 
+# libyaml's C loader parses 3-5x faster than the pure-Python one and every
+# CLI invocation pays this parse; fall back quietly when PyYAML was built
+# without the extension
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from .constants import (
     DEFAULT_QUALITY_THRESHOLD,
     SEMGREP_TIMEOUT,
@@ -87,7 +95,7 @@ class ConfigManager:
     def load(self) -> dict:
         """Load configuration from config.yaml"""
         if CONFIG_PATH.exists():
-            config = yaml.safe_load(CONFIG_PATH.read_text()) or {}
+            config = yaml.load(CONFIG_PATH.read_text(), Loader=_Loader) or {}
         else:
             config = {}
 
@@ -469,7 +477,7 @@ class StateManager:
     def load(self) -> dict:
         """Load state from state.yaml"""
         if STATE_PATH.exists():
-            return yaml.safe_load(STATE_PATH.read_text()) or {}
+            return yaml.load(STATE_PATH.read_text(), Loader=_Loader) or {}
         return {}
 
     def save(self, state: dict):
@@ -1,9 +1,12 @@
 import contextlib
+import functools
+import os
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Generator, Optional
 import git
-from git.exc import InvalidGitRepositoryError
+from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from ...utils.security import is_excluded
 from .constants import (
@@ -18,17 +21,44 @@ class NotAGitRepoError(Exception):
     pass
 
 
-def init_git_repo(remote_url: Optional[str] = None) -> git.Repo:
+@dataclass
+class ChangeSet:
     """
-    Initialize a new git repository in the current directory.
+    Struct-of-arrays view of changed files.
+
+    Parallel arrays instead of a dict per file: one str and one status byte
+    per entry, so large monorepo diffs don't pay dict overhead per path.
+    Conflict entries always come first (source priority), so `conflicts` is
+    just the length of that prefix.
+    """
+    files: List[str]
+    statuses: bytearray
+    conflicts: int = 0
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self):
+        """Iterate (file, status) pairs."""
+        return ((f, chr(s)) for f, s in zip(self.files, self.statuses))
+
+    def status_map(self) -> dict:
+        """Return a {file: status} mapping."""
+        return {f: chr(s) for f, s in zip(self.files, self.statuses)}
+
+
+def init_git_repo(remote_url: Optional[str] = None, path: Optional[Path] = None) -> git.Repo:
+    """
+    Initialize a new git repository.
 
     Args:
         remote_url: Optional remote URL to add as origin
+        path: Directory to initialize (defaults to the current directory)
 
     Returns:
         The initialized git.Repo object
     """
-    repo = git.Repo.init(".")
+    repo = git.Repo.init(path or ".")
 
     # Add remote if provided
     if remote_url:
@@ -38,43 +68,151 @@ def init_git_repo(remote_url: Optional[str] = None) -> git.Repo:
 
 
 class GitOps:
-    def __init__(self, auto_init: bool = False, remote_url: Optional[str] = None):
+    def __init__(
+        self,
+        auto_init: bool = False,
+        remote_url: Optional[str] = None,
+        path: Optional[Path] = None,
+    ):
         """
         Initialize GitOps.
 
         Args:
             auto_init: If True, automatically initialize git repo if not exists
             remote_url: Remote URL to add when auto-initializing
+            path: Repository path (defaults to the current directory); all
+                operations anchor on the repo root, not the process cwd
         """
         try:
-            self.repo = git.Repo(".", search_parent_directories=True)
+            self.repo = git.Repo(path or ".", search_parent_directories=True)
         except InvalidGitRepositoryError:
             if auto_init:
-                self.repo = init_git_repo(remote_url)
+                self.repo = init_git_repo(remote_url, path=path)
             else:
                 raise NotAGitRepoError(
                     "Not a git repository. Please run 'git init' first or navigate to a git repository."
                 )
-        self.original_branch = self.repo.active_branch.name if self.repo.head.is_valid() else "main"
-
-    def get_changes(self, include_excluded: bool = False, staged_only: bool = False) -> List[dict]:
+        # HEAD validity only flips False -> True (at the first commit), so it
+        # is cached here instead of re-reading refs from disk on every
+        # _collect call; commit paths flip the flag
+        self._head_valid = self.repo.head.is_valid()
+        self.original_branch = self.repo.active_branch.name if self._head_valid else "main"
+        # (head_hexsha, per-source change lists) memo for _collect; cleared
+        # whenever this instance mutates the index or working tree
+        self._collect_cache = None
+        # Per-instance memoized exclusion matcher: the pattern set is static,
+        # so each path only has to be matched once per GitOps lifetime
+        self._excluded = functools.lru_cache(maxsize=None)(is_excluded)
+
+    def _collect(self) -> dict:
         """
-        Get list of changed files in the repository.
+        Walk git state once and tag every changed path with its exclusion flag.
 
-        Args:
-            include_excluded: If True, include sensitive/excluded files (not recommended)
-            staged_only: If True, only return staged (index) changes, ignore unstaged/untracked
+        get_changes and get_excluded_changes used to traverse untracked files
+        and both index diffs independently (and call is_excluded twice per
+        path); callers that need both paid the GitPython diff cost twice.
+        This does one walk and memoizes per HEAD commit.
 
         Returns:
-            List of {"file": path, "status": "U"|"M"|"A"|"D"|"C"} dicts
-            C = Conflict (unmerged)
+            {"conflict"|"untracked"|"unstaged"|"staged": [(file, status, excluded), ...]}
         """
-        changes = []
-        seen = set()
+        head_key = self.repo.head.commit.hexsha if self._head_valid else None
+        if self._collect_cache is not None and self._collect_cache[0] == head_key:
+            return self._collect_cache[1]
+
+        try:
+            sources = self._collect_porcelain(has_head=head_key is not None)
+        except Exception:
+            # Parsing problem or exotic git version - fall back to the
+            # GitPython object walk
+            sources = self._collect_gitpython(has_head=head_key is not None)
+
+        self._collect_cache = (head_key, sources)
+        return sources
 
-        # First, check for merge conflicts (unmerged files)
-        # These need special handling as they don't appear in normal diffs
-        # Note: Conflicts are always included even in staged_only mode
+    def _collect_porcelain(self, has_head: bool) -> dict:
+        """
+        Collect all change sources from one `git status --porcelain=v2 -z` call.
+
+        GitPython's untracked_files + two index.diff() passes materialize a
+        Diff/Blob object per path; for large repos that is O(N) Python
+        allocations on every status check. git emits the same information as
+        one compact NUL-delimited byte stream parsed by a tight loop here.
+        """
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"],
+            capture_output=True,
+            cwd=self.repo.working_dir
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode(errors="replace"))
+
+        excluded = self._excluded
+        sources = {"conflict": [], "untracked": [], "unstaged": [], "staged": []}
+
+        tokens = result.stdout.split(b"\0")
+        i = 0
+        while i < len(tokens):
+            record = tokens[i]
+            i += 1
+            if not record:
+                continue
+            kind = record[:1]
+
+            if kind == b"?":
+                # "? <path>"
+                f = record[2:].decode()
+                sources["untracked"].append((f, "U", excluded(f)))
+
+            elif kind == b"1":
+                # "1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>"
+                parts = record.split(b" ", 8)
+                xy = parts[1].decode()
+                f = parts[8].decode()
+                if xy[1] != ".":
+                    sources["unstaged"].append((f, "D" if xy[1] == "D" else "M", excluded(f)))
+                if has_head and xy[0] != ".":
+                    status = "A" if xy[0] == "A" else ("D" if xy[0] == "D" else "M")
+                    sources["staged"].append((f, status, excluded(f)))
+
+            elif kind == b"2":
+                # "2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path>"
+                # followed by the original path as its own NUL-terminated token
+                parts = record.split(b" ", 9)
+                xy = parts[1].decode()
+                f = parts[9].decode()
+                orig = tokens[i].decode()
+                i += 1
+                if xy[1] != ".":
+                    sources["unstaged"].append((f, "M", excluded(f)))
+                if has_head and xy[0] != ".":
+                    # index.diff("HEAD") has no rename detection, so a staged
+                    # rename surfaces as add + delete - keep that shape
+                    sources["staged"].append((f, "A", excluded(f)))
+                    sources["staged"].append((orig, "D", excluded(orig)))
+
+            elif kind == b"u":
+                # "u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>"
+                parts = record.split(b" ", 10)
+                xy = parts[1].decode()
+                f = parts[10].decode()
+                if xy in GIT_CONFLICT_STATUSES:
+                    # For "deleted by them" (UD) or "deleted by us" (DU),
+                    # mark as deleted if we want to accept the deletion
+                    status = "D" if xy in GIT_DELETED_CONFLICT_STATUSES else "C"
+                    sources["conflict"].append((f, status, excluded(f)))
+
+            # "!" (ignored files) are not requested and not interesting
+
+        return sources
+
+    def _collect_gitpython(self, has_head: bool) -> dict:
+        """Fallback change collection via GitPython object diffs."""
+        excluded = self._excluded
+        sources = {"conflict": [], "untracked": [], "unstaged": [], "staged": []}
+
+        # Merge conflicts (unmerged files) need special handling as they
+        # don't appear in normal diffs
         try:
             result = subprocess.run(
                 ["git", "status", "--porcelain"],
@@ -95,52 +233,97 @@ class GitOps:
                         # Handle renamed files (old -> new format)
                         if " -> " in filepath:
                             filepath = filepath.split(" -> ")[-1]
-                        # Check for unmerged (conflict) statuses
                         if xy in GIT_CONFLICT_STATUSES:
-                            if filepath not in seen:
-                                seen.add(filepath)
-                                if include_excluded or not is_excluded(filepath):
-                                    # For "deleted by them" (UD) or "deleted by us" (DU),
-                                    # mark as deleted if we want to accept the deletion
-                                    if xy in GIT_DELETED_CONFLICT_STATUSES:
-                                        changes.append({"file": filepath, "status": "D", "conflict": True})
-                                    else:
-                                        changes.append({"file": filepath, "status": "C", "conflict": True})
+                            # For "deleted by them" (UD) or "deleted by us" (DU),
+                            # mark as deleted if we want to accept the deletion
+                            status = "D" if xy in GIT_DELETED_CONFLICT_STATUSES else "C"
+                            sources["conflict"].append((filepath, status, excluded(filepath)))
         except Exception:
             pass
 
-        # Skip untracked and unstaged if staged_only mode
-        if not staged_only:
-            # Untracked files (new files not yet added to git)
-            for f in self.repo.untracked_files:
-                if f not in seen:
-                    seen.add(f)
-                    if include_excluded or not is_excluded(f):
-                        changes.append({"file": f, "status": "U"})
-
-            # Unstaged changes (modified in working directory but not staged)
-            for item in self.repo.index.diff(None):
-                f = item.a_path or item.b_path
-                if f not in seen:
-                    seen.add(f)
-                    if include_excluded or not is_excluded(f):
-                        status = "D" if item.deleted_file else "M"
-                        changes.append({"file": f, "status": status})
+        # Untracked files (new files not yet added to git)
+        for f in self.repo.untracked_files:
+            sources["untracked"].append((f, "U", excluded(f)))
+
+        # Unstaged changes (modified in working directory but not staged)
+        for item in self.repo.index.diff(None):
+            f = item.a_path or item.b_path
+            status = "D" if item.deleted_file else "M"
+            sources["unstaged"].append((f, status, excluded(f)))
 
         # Staged changes (added to index, ready to commit)
-        if self.repo.head.is_valid():
+        if has_head:
             for item in self.repo.index.diff("HEAD"):
                 f = item.a_path or item.b_path
-                if f not in seen:
-                    seen.add(f)
-                    if include_excluded or not is_excluded(f):
-                        if item.new_file:
-                            status = "A"
-                        elif item.deleted_file:
-                            status = "D"
-                        else:
-                            status = "M"
-                        changes.append({"file": f, "status": status})
+                if item.new_file:
+                    status = "A"
+                elif item.deleted_file:
+                    status = "D"
+                else:
+                    status = "M"
+                sources["staged"].append((f, status, excluded(f)))
+
+        return sources
+
+    def get_changeset(self, include_excluded: bool = False, staged_only: bool = False) -> ChangeSet:
+        """
+        Get changed files as a compact ChangeSet (struct of arrays).
+
+        Args:
+            include_excluded: If True, include sensitive/excluded files (not recommended)
+            staged_only: If True, only return staged (index) changes, ignore unstaged/untracked
+
+        Returns:
+            ChangeSet with statuses "U"|"M"|"A"|"D"|"C" (C = conflict/unmerged)
+        """
+        sources = self._collect()
+
+        # Dedupe with a single dict keyed by path: setdefault does the
+        # membership probe and the insert in one hash lookup, and insertion
+        # order preserves the source priority (first source wins).
+        # Conflicts are always included even in staged_only mode.
+        order = ("conflict", "staged") if staged_only else ("conflict", "untracked", "unstaged", "staged")
+        result = {}
+        for source in order:
+            is_conflict = source == "conflict"
+            for f, status, excluded in sources[source]:
+                result.setdefault(f, (status, is_conflict, excluded))
+
+        files: List[str] = []
+        statuses = bytearray()
+        conflicts = 0
+        for f, (status, is_conflict, excluded) in result.items():
+            if include_excluded or not excluded:
+                files.append(f)
+                statuses.append(ord(status))
+                if is_conflict:
+                    conflicts += 1
+
+        return ChangeSet(files, statuses, conflicts)
+
+    def get_changes(self, include_excluded: bool = False, staged_only: bool = False) -> List[dict]:
+        """
+        Get list of changed files in the repository.
+
+        Compatibility wrapper over get_changeset for callers that expect
+        per-file dicts; new code should prefer the ChangeSet.
+
+        Args:
+            include_excluded: If True, include sensitive/excluded files (not recommended)
+            staged_only: If True, only return staged (index) changes, ignore unstaged/untracked
+
+        Returns:
+            List of {"file": path, "status": "U"|"M"|"A"|"D"|"C"} dicts
+            C = Conflict (unmerged)
+        """
+        changeset = self.get_changeset(include_excluded, staged_only)
+
+        changes = []
+        for i, (f, status) in enumerate(changeset):
+            if i < changeset.conflicts:
+                changes.append({"file": f, "status": status, "conflict": True})
+            else:
+                changes.append({"file": f, "status": status})
 
         return changes
 
@@ -149,31 +332,14 @@ class GitOps:
         Get list of excluded files that have changes.
         Useful for showing user what was filtered out.
         """
-        excluded = []
-        seen = set()
+        sources = self._collect()
 
-        # Check untracked files
-        for f in self.repo.untracked_files:
-            if f not in seen and is_excluded(f):
-                seen.add(f)
-                excluded.append(f)
+        first = {}
+        for source in ("untracked", "unstaged", "staged"):
+            for f, _status, is_exc in sources[source]:
+                first.setdefault(f, is_exc)
 
-        # Check unstaged changes
-        for item in self.repo.index.diff(None):
-            f = item.a_path or item.b_path
-            if f not in seen and is_excluded(f):
-                seen.add(f)
-                excluded.append(f)
-
-        # Check staged changes
-        if self.repo.head.is_valid():
-            for item in self.repo.index.diff("HEAD"):
-                f = item.a_path or item.b_path
-                if f not in seen and is_excluded(f):
-                    seen.add(f)
-                    excluded.append(f)
-
-        return excluded
+        return [f for f, is_exc in first.items() if is_exc]
 
     def has_commits(self) -> bool:
         """Check if the repository has any commits."""
@@ -337,10 +503,11 @@ class GitOps:
         """
         base_branch = self.original_branch
         is_empty_repo = not self.has_commits()
+        self._collect_cache = None
 
         # Filter out excluded files (but keep deleted files)
         # Get current changes to check for deleted files
-        current_changes = {c["file"]: c["status"] for c in self.get_changes()}
+        current_changes = self.get_changeset().status_map()
 
         # Get git root directory for resolving relative paths
         git_root = Path(self.repo.working_dir)
@@ -348,7 +515,7 @@ class GitOps:
         safe_files = []
         deleted_files = []
         for f in files:
-            if is_excluded(f):
+            if self._excluded(f):
                 continue
             # Check if file is deleted (either in git status or doesn't exist)
             # Use git root to resolve paths correctly when running from subdirectory
@@ -492,17 +659,18 @@ class GitOps:
                 # New repo without commits - create orphan branch
                 try:
                     self.repo.git.checkout("--orphan", branch_name)
-                except Exception:
+                except GitCommandError:
                     pass
             else:
-                # Existing repo - create branch from HEAD
+                # Existing repo - create branch from HEAD. Checking heads up
+                # front avoids letting a doomed `checkout -b` subprocess fail
+                # just to discover the branch already exists.
+                if branch_name in {h.name for h in self.repo.heads}:
+                    branch_name = f"{branch_name}-v2"
                 try:
                     self.repo.git.checkout("-b", branch_name)
-                except Exception:
-                    try:
-                        self.repo.git.checkout("-b", f"{branch_name}-v2")
-                    except Exception:
-                        pass
+                except GitCommandError:
+                    pass
 
             yield
 
@@ -510,23 +678,19 @@ class GitOps:
             # After commit, return to original branch
             if is_new_repo:
                 # For new repos, after first commit we can switch branches normally
-                try:
-                    # Check if we made a commit
-                    if self.has_commits():
-                        # Create/checkout main branch
+                if self.has_commits():
+                    # Create/checkout main branch
+                    try:
+                        self.repo.git.checkout("-b", original_branch)
+                    except GitCommandError:
                         try:
-                            self.repo.git.checkout("-b", original_branch)
-                        except Exception:
-                            try:
-                                self.repo.git.checkout(original_branch)
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+                            self.repo.git.checkout(original_branch)
+                        except GitCommandError:
+                            pass
             else:
                 try:
                     self.repo.git.checkout(original_branch)
-                except Exception:
+                except GitCommandError:
                     pass
 
     def stage_files(self, files: List[str]) -> tuple:
@@ -539,24 +703,29 @@ class GitOps:
         Returns:
             (staged_files, excluded_files) tuple
         """
+        self._collect_cache = None
         staged = []
         excluded = []
 
         # Get git root directory for resolving relative paths
-        git_root = Path(self.repo.working_dir)
+        git_root = str(self.repo.working_dir)
 
         for f in files:
             # Skip excluded files - NEVER stage them
-            if is_excluded(f):
+            if self._excluded(f):
                 excluded.append(f)
                 continue
 
-            # Check if file exists relative to git root (not current directory)
-            file_path = git_root / f
-            if file_path.exists():
-                self.repo.index.add([f])
+            # Check if file exists relative to git root (not current directory);
+            # lexists also keeps broken symlinks stageable
+            if os.path.lexists(os.path.join(git_root, f)):
                 staged.append(f)
 
+        # One batched index.add: GitPython serializes the index per call, so
+        # adding file-by-file costs O(N) index writes
+        if staged:
+            self.repo.index.add(staged)
+
         return staged, excluded
 
     def commit(self, message: str, files: List[str] = None):
@@ -567,7 +736,9 @@ class GitOps:
             message: Commit message
             files: If provided, reset these files in working directory after commit
         """
+        self._collect_cache = None
         self.repo.index.commit(message)
+        self._head_valid = True
 
         # After committing, the files are in the branch's history
         # We need to remove them from the working directory so they don't
@@ -627,6 +798,7 @@ class GitOps:
 
             # Commit - this creates the initial commit and the branch
             self.repo.index.commit(message)
+            self._head_valid = True
 
             # Update original_branch now that we have a commit
             # This is crucial for subsequent commits to use normal branch flow
@@ -664,6 +836,8 @@ class GitOps:
         Returns:
             True if successful, False otherwise
         """
+        self._collect_cache = None
+
         # Stash current changes first
         stash_created = False
         try:
@@ -727,6 +901,8 @@ class GitOps:
         Returns:
             (success: bool, is_new: bool, error_message: str or None)
         """
+        self._collect_cache = None
+
         # Stash current changes first
         stash_created = False
         try:
@@ -923,13 +1099,14 @@ class GitOps:
             True if successful (committed and merged)
         """
         # Filter out excluded files (but keep deleted files)
-        current_changes = {c["file"]: c["status"] for c in self.get_changes()}
+        current_changes = self.get_changeset().status_map()
+        self._collect_cache = None
         git_root = Path(self.repo.working_dir)
 
         safe_files = []
         deleted_files = []
         for f in files:
-            if is_excluded(f):
+            if self._excluded(f):
                 continue
             file_path = git_root / f
             status = current_changes.get(f)
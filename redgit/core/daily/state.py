@@ -2,6 +2,8 @@
 Daily state management for tracking last run time.
 """
 
+import json
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
@@ -10,6 +12,16 @@ import yaml
 
 DAILY_STATE_PATH = Path(".redgit/daily_state.yaml")
 
+# Relative 'since' suffixes mapped to seconds, so the hot Nh/Nd/Nw paths
+# do plain integer arithmetic on the epoch instead of building a timedelta
+_SINCE_UNITS = {"h": 3600, "d": 86400, "w": 604800}
+
+# Keyword handlers dispatched by one dict probe instead of an equality chain
+_SINCE_KEYWORDS = {
+    "yesterday": lambda now: (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0),
+    "today": lambda now: now.replace(hour=0, minute=0, second=0, microsecond=0),
+}
+
 
 class DailyStateManager:
     """Manages daily command state (last run timestamp)."""
@@ -20,12 +32,22 @@ class DailyStateManager:
     def load(self) -> dict:
         """Load state from daily_state.yaml"""
         if DAILY_STATE_PATH.exists():
-            return yaml.safe_load(DAILY_STATE_PATH.read_text()) or {}
+            text = DAILY_STATE_PATH.read_text()
+            if not text.strip():
+                return {}
+            # State is written as JSON (which is valid YAML, so the file
+            # keeps its name); json's C parser is far cheaper than PyYAML
+            # for this tiny dict. Fall back for files written by older
+            # versions.
+            try:
+                return json.loads(text) or {}
+            except ValueError:
+                return yaml.safe_load(text) or {}
         return {}
 
     def save(self, state: dict):
         """Save state to daily_state.yaml"""
-        DAILY_STATE_PATH.write_text(yaml.dump(state, allow_unicode=True, sort_keys=False))
+        DAILY_STATE_PATH.write_text(json.dumps(state, ensure_ascii=False, default=str))
 
     def get_last_run(self) -> Optional[datetime]:
         """Get the timestamp of the last daily run."""
@@ -70,39 +92,21 @@ class DailyStateManager:
         - ISO date: '2024-01-15' or '2024-01-15T10:00:00'
         """
         since = since.strip().lower()
-        now = datetime.now()
-
-        # Hours
-        if since.endswith('h'):
-            try:
-                hours = int(since[:-1])
-                return now - timedelta(hours=hours)
-            except ValueError:
-                pass
 
-        # Days
-        if since.endswith('d'):
-            try:
-                days = int(since[:-1])
-                return now - timedelta(days=days)
-            except ValueError:
-                pass
+        # Relative offsets: one suffix lookup, with isdigit guarding the
+        # numeric prefix so malformed input never raises at all
+        unit_seconds = _SINCE_UNITS.get(since[-1:])
+        if unit_seconds:
+            num = since[:-1]
+            if num.isdigit():
+                return datetime.fromtimestamp(time.time() - int(num) * unit_seconds)
 
-        # Weeks
-        if since.endswith('w'):
-            try:
-                weeks = int(since[:-1])
-                return now - timedelta(weeks=weeks)
-            except ValueError:
-                pass
+        now = datetime.now()
 
         # Special keywords
-        if since == 'yesterday':
-            yesterday = now - timedelta(days=1)
-            return yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        if since == 'today':
-            return now.replace(hour=0, minute=0, second=0, microsecond=0)
+        handler = _SINCE_KEYWORDS.get(since)
+        if handler:
+            return handler(now)
 
         # Try ISO format
         try:
@@ -11,12 +11,22 @@ Integration Types:
 """
 
 import os
+import sys
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+# The dataclasses below are built in bulk (issue lists, pipeline runs),
+# so dropping the per-instance __dict__ pays off in memory and attribute
+# access. dataclass(slots=True) needs Python 3.10; on 3.9 these fall
+# back to plain dataclasses with identical behaviour.
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS = {"slots": True}
+else:  # pragma: no cover
+    _DATACLASS_KWARGS = {}
+
 
 class IntegrationType(Enum):
     TASK_MANAGEMENT = "task_management"
@@ -28,7 +38,7 @@ class IntegrationType(Enum):
     TUNNEL = "tunnel"
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Issue:
     """Standardized issue representation across task management systems"""
     key: str              # e.g., "SCRUM-123", "LINEAR-456"
@@ -45,7 +55,7 @@ class Issue:
     parent_summary: Optional[str] = None  # Parent issue/epic title
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Sprint:
     """Standardized sprint representation"""
     id: str
@@ -56,7 +66,7 @@ class Sprint:
     goal: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class PipelineRun:
     """Standardized pipeline/workflow run representation"""
     id: str
@@ -71,7 +81,7 @@ class PipelineRun:
     trigger: Optional[str] = None   # "push", "pr", "manual", "schedule"
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class PipelineJob:
     """Standardized job/step representation within a pipeline"""
     id: str
@@ -85,7 +95,7 @@ class PipelineJob:
     logs_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class QualityReport:
     """Standardized code quality report representation"""
     id: str
@@ -106,7 +116,7 @@ class QualityReport:
     quality_gate_details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class SecurityIssue:
     """Standardized security issue/vulnerability representation"""
     id: str
@@ -123,7 +133,7 @@ class SecurityIssue:
     line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class CoverageReport:
     """Standardized code coverage report representation"""
     id: str
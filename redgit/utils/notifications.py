@@ -10,9 +10,12 @@ Features:
 - Interactive message support (buttons, polls)
 """
 
+import atexit
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass, field
-from ..core.common.config import ConfigManager
+from ..core.common.config import DEFAULT_NOTIFICATIONS
 from ..integrations.registry import get_notification
 
 
@@ -165,6 +168,16 @@ class NotificationService:
     of notifications while handling configuration checks and error handling.
     """
 
+    # No __dict__: the backward-compat helpers can instantiate one of these
+    # per call, so the fixed attribute set is worth pinning down
+    __slots__ = ("__weakref__", "config", "_notification", "_initialized", "_master", "_event_cache", "_pending")
+
+    # Shared executor for async sends: webhook notifications are network
+    # round-trips, so a handful of threads collapses a push flow's
+    # sequential sends into the latency of the slowest one. Created on
+    # first use and drained at interpreter exit.
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(self, config: dict):
         """
         Initialize the notification service.
@@ -172,10 +185,16 @@ class NotificationService:
         Args:
             config: The application configuration dictionary
         """
-        self.config = config
-        self._config_manager = ConfigManager()
+        self.config = config or {}
         self._notification = None
         self._initialized = False
+        # Master switch, resolved once: with notifications globally off we can
+        # bail out of send() before the integration plugin is ever imported
+        self._master = bool(
+            self.config.get("notifications", {}).get("enabled", DEFAULT_NOTIFICATIONS["enabled"])
+        )
+        self._event_cache: Dict[str, bool] = {}
+        self._pending: List[Future] = []
 
     @property
     def notification(self):
@@ -195,7 +214,24 @@ class NotificationService:
         Returns:
             True if notifications are enabled for this event
         """
-        return self._config_manager.is_notification_enabled(event)
+        # Master switch
+        if not self._master:
+            return False
+
+        if event in self._event_cache:
+            return self._event_cache[event]
+
+        # Event-specific setting (fall back to shipped defaults); cached so
+        # bulk sends (e.g. send_issue_completed over many issues) resolve each
+        # event name once. Reads the passed-in config directly; callers
+        # already hold the loaded config, so no file re-read is needed here.
+        events = self.config.get("notifications", {}).get("events", {})
+        if event in events:
+            enabled = bool(events[event])
+        else:
+            enabled = DEFAULT_NOTIFICATIONS["events"].get(event, True)
+        self._event_cache[event] = enabled
+        return enabled
 
     def send(self, event: str, message: str) -> bool:
         """
@@ -208,7 +244,9 @@ class NotificationService:
         Returns:
             True if notification was sent successfully
         """
-        if not self.is_enabled(event):
+        # Globally disabled: skip before the notification property triggers
+        # the integration plugin load
+        if not self._master or not self.is_enabled(event):
             return False
 
         if not self.notification or not self.notification.enabled:
@@ -221,28 +259,70 @@ class NotificationService:
             # Notification failure shouldn't break the flow
             return False
 
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="redgit-notify")
+            atexit.register(cls._executor.shutdown, wait=True)
+        return cls._executor
+
+    def send_async(self, event: str, message: str) -> Future:
+        """
+        Send a notification on the shared executor without blocking.
+
+        Args:
+            event: Event name for configuration check
+            message: Message to send
+
+        Returns:
+            Future resolving to send()'s bool result; also tracked in the
+            pending list so flush() can wait on it
+        """
+        future = self._get_executor().submit(self.send, event, message)
+        self._pending.append(future)
+        return future
+
+    def flush(self) -> None:
+        """Wait for all pending async notifications to finish."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                # Notification failure shouldn't break the flow
+                pass
+
+    def _dispatch(self, event: str, message: str, async_: bool) -> bool:
+        """Send now, or queue on the executor (reporting success as queued)."""
+        if async_:
+            self.send_async(event, message)
+            return True
+        return self.send(event, message)
+
     # =========================================================================
     # CONVENIENCE METHODS
     # =========================================================================
 
-    def send_push(self, branch: str, issues: Optional[List[str]] = None) -> bool:
+    def send_push(self, branch: str, issues: Optional[List[str]] = None, async_: bool = False) -> bool:
         """
         Send notification about successful push.
 
         Args:
             branch: Branch name that was pushed
             issues: Optional list of related issue keys
+            async_: If True, queue on the executor instead of blocking
         """
         message = f"Pushed `{branch}` to remote"
         if issues:
             message += f"\nIssues: {', '.join(issues)}"
-        return self.send("push", message)
+        return self._dispatch("push", message, async_)
 
     def send_pr_created(
         self,
         branch: str,
         pr_url: str,
-        issue_key: Optional[str] = None
+        issue_key: Optional[str] = None,
+        async_: bool = False
     ) -> bool:
         """
         Send notification about PR creation.
@@ -251,18 +331,20 @@ class NotificationService:
             branch: Branch name for the PR
             pr_url: URL of the created PR
             issue_key: Optional related issue key
+            async_: If True, queue on the executor instead of blocking
         """
         message = f"PR created for `{branch}`"
         if issue_key:
             message += f" ({issue_key})"
         message += f"\n{pr_url}"
-        return self.send("pr_created", message)
+        return self._dispatch("pr_created", message, async_)
 
     def send_ci_result(
         self,
         branch: str,
         status: str,
-        url: Optional[str] = None
+        url: Optional[str] = None,
+        async_: bool = False
     ) -> bool:
         """
         Send notification about CI/CD pipeline result.
@@ -271,6 +353,7 @@ class NotificationService:
             branch: Branch name
             status: Pipeline status ('success' or 'failure')
             url: Optional pipeline URL
+            async_: If True, queue on the executor instead of blocking
         """
         event = "ci_success" if status == "success" else "ci_failure"
 
@@ -282,14 +365,15 @@ class NotificationService:
         if url:
             message += f"\n{url}"
 
-        return self.send(event, message)
+        return self._dispatch(event, message, async_)
 
-    def send_issue_completed(self, issues: List[str]) -> bool:
+    def send_issue_completed(self, issues: List[str], async_: bool = False) -> bool:
         """
         Send notification about issues marked as done.
 
         Args:
             issues: List of issue keys that were completed
+            async_: If True, queue on the executor instead of blocking
         """
         if not issues:
             return False
@@ -299,7 +383,7 @@ class NotificationService:
         else:
             message = f"{len(issues)} issues marked as Done: {', '.join(issues)}"
 
-        return self.send("issue_completed", message)
+        return self._dispatch("issue_completed", message, async_)
 
     def send_issue_created(
         self,
@@ -600,6 +684,22 @@ class NotificationService:
 # HELPER FUNCTIONS (for backward compatibility)
 # =============================================================================
 
+# One NotificationService per config dict, so hot commit/push loops don't
+# rebuild the service (and re-run the integration lookup) on every call.
+# Keyed by id(config): each service strongly references its config, so an
+# entry can only expire together with its service, which makes id reuse safe.
+_services: "weakref.WeakValueDictionary[int, NotificationService]" = weakref.WeakValueDictionary()
+
+
+def _get_service(config: dict) -> NotificationService:
+    """Get (or create) the cached NotificationService for a config dict."""
+    service = _services.get(id(config))
+    if service is None:
+        service = NotificationService(config)
+        _services[id(config)] = service
+    return service
+
+
 def is_notification_enabled(config: dict, event: str) -> bool:
     """
     Check if notification is enabled for a specific event.
@@ -613,7 +713,7 @@ def is_notification_enabled(config: dict, event: str) -> bool:
     Returns:
         True if notifications are enabled for this event
     """
-    service = NotificationService(config)
+    service = _get_service(config)
     return service.is_enabled(event)
 
 
@@ -635,5 +735,5 @@ def send_notification(
     Returns:
         True if notification was sent successfully
     """
-    service = NotificationService(config)
+    service = _get_service(config)
     return service.send(event, message)
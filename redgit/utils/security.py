@@ -9,6 +9,7 @@ This module provides functions to:
 
 import os
 import fnmatch
+import re
 from pathlib import Path
 from typing import List, Set
 
@@ -128,6 +129,17 @@ SENSITIVE_PATTERNS = [
 ]
 
 
+# Patterns are static, so compile them once at import instead of running
+# fnmatch per pattern per call: directory prefixes become a plain tuple scan,
+# everything else one alternation regex (matched against both the full path
+# and the basename, like the original per-pattern fnmatch calls).
+_EXCLUDED_DIRS = tuple(p.rstrip("/") for p in ALWAYS_EXCLUDED if p.endswith("/"))
+_EXCLUDED_GLOBS_RE = re.compile(
+    "|".join(fnmatch.translate(p) for p in ALWAYS_EXCLUDED if not p.endswith("/"))
+)
+_SAFE_FILES_RE = re.compile("|".join(fnmatch.translate(p) for p in SAFE_FILES))
+
+
 def is_excluded(file_path: str) -> bool:
     """
     Check if a file should be excluded from AI and git operations.
@@ -143,23 +155,18 @@ def is_excluded(file_path: str) -> bool:
     file_name = os.path.basename(file_path)
 
     # Check if file is explicitly safe (e.g., .env.example)
-    for safe_file in SAFE_FILES:
-        if file_name == safe_file or fnmatch.fnmatch(file_name, safe_file):
-            return False
-
-    # Check against always excluded patterns
-    for pattern in ALWAYS_EXCLUDED:
-        # Directory pattern (ends with /)
-        if pattern.endswith("/"):
-            dir_name = pattern.rstrip("/")
-            if file_path.startswith(dir_name + "/") or file_path == dir_name:
-                return True
-        # Glob pattern
-        elif fnmatch.fnmatch(file_path, pattern):
-            return True
-        elif fnmatch.fnmatch(file_name, pattern):
+    if _SAFE_FILES_RE.match(file_name):
+        return False
+
+    # Directory patterns (e.g. .redgit/, vendor/)
+    for dir_name in _EXCLUDED_DIRS:
+        if file_path.startswith(dir_name + "/") or file_path == dir_name:
             return True
 
+    # Glob patterns against full path and basename
+    if _EXCLUDED_GLOBS_RE.match(file_path) or _EXCLUDED_GLOBS_RE.match(file_name):
+        return True
+
     return False
 
 
@@ -11,41 +11,155 @@ from typing import Generator
 import pytest
 import yaml
 
+# Imported once here so the first git-backed test doesn't pay GitPython's
+# cold-import cost inside its own wall time (and xdist workers pay it once
+# per worker, not per test module).
+from git import Repo
+from redgit.core.common.gitops import GitOps
+
+
+# RAM-backed temp dirs (opt-in via REDGIT_TEST_TMPFS=1): /dev/shm is tmpfs
+# on Linux, so repo setup and file writes hit the page cache with no disk
+# flush. None falls back to the platform default temp dir.
+_TMPFS_BASE = (
+    "/dev/shm"
+    if os.environ.get("REDGIT_TEST_TMPFS") == "1" and os.path.isdir("/dev/shm")
+    else None
+)
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp())
+    """Create a temporary directory for tests.
+
+    The path is resolved once here (macOS /tmp is a symlink) so tests can
+    compare against it without a realpath call per assertion.
+    """
+    temp_path = Path(tempfile.mkdtemp(dir=_TMPFS_BASE)).resolve()
     yield temp_path
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
-@pytest.fixture
-def temp_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary git repository."""
-    import subprocess
-
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_dir, capture_output=True
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir, capture_output=True
-    )
+@pytest.fixture(scope="session")
+def _session_git_repo():
+    """Create the shared test git repository once per session.
+
+    Building a repo (init + config + initial commit) is the most expensive
+    part of the git-backed tests, so it happens once; temp_git_repo resets
+    the repo to this initial state between tests.
+    """
+    temp_path = Path(tempfile.mkdtemp(dir=_TMPFS_BASE)).resolve()
+    repo = Repo.init(temp_path)
+    with repo.config_writer() as cw:
+        cw.set_value("user", "email", "test@example.com")
+        cw.set_value("user", "name", "Test User")
 
     # Create initial commit
-    readme = temp_dir / "README.md"
+    readme = temp_path / "README.md"
     readme.write_text("# Test Repository\n")
-    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir, capture_output=True
-    )
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
 
-    yield temp_dir
+    initial_sha = repo.head.commit.hexsha
+    original_branch = repo.active_branch.name
+
+    yield temp_path, repo, initial_sha, original_branch
+
+    repo.close()
+    shutil.rmtree(temp_path, ignore_errors=True)
+
+
+@pytest.fixture
+def temp_git_repo(_session_git_repo) -> Generator[Path, None, None]:
+    """Yield the shared git repository, restored to its initial commit.
+
+    Teardown puts the repo back exactly as the session fixture created it:
+    original branch at the initial commit, clean working tree, and no
+    branches or remotes left over from the test.
+    """
+    temp_path, repo, initial_sha, original_branch = _session_git_repo
+
+    yield temp_path
+
+    repo.git.checkout("-f", original_branch)
+    repo.git.reset("--hard", initial_sha)
+    repo.git.clean("-fdx")
+    for branch in list(repo.branches):
+        if branch.name != original_branch:
+            repo.delete_head(branch, force=True)
+    for remote in list(repo.remotes):
+        repo.delete_remote(remote)
+    for tag in list(repo.tags):
+        repo.delete_tag(tag)
+
+
+@pytest.fixture(scope="session")
+def _session_gitops(_session_git_repo):
+    """Construct a GitOps against the session repo once."""
+    temp_path, _repo, _initial_sha, _original_branch = _session_git_repo
+    return GitOps(path=temp_path)
+
+
+@pytest.fixture(scope="session")
+def _empty_repo_template():
+    """Run git init once into a template dir; tests copy its .git.
+
+    Copying ~50 small files is much cheaper than a git init fork+exec
+    per empty-repo test.
+    """
+    template = Path(tempfile.mkdtemp(dir=_TMPFS_BASE))
+    repo = Repo.init(template)
+    with repo.config_writer() as cw:
+        cw.set_value("user", "email", "test@example.com")
+        cw.set_value("user", "name", "Test User")
+    repo.close()
+    yield template / ".git"
+    shutil.rmtree(template, ignore_errors=True)
+
+
+@pytest.fixture
+def empty_gitops(temp_dir, _empty_repo_template):
+    """GitOps on a fresh empty repo (no commits) in temp_dir."""
+    shutil.copytree(_empty_repo_template, temp_dir / ".git")
+    gitops = GitOps(path=temp_dir)
+    assert not gitops.repo.head.is_valid()
+    return gitops
+
+
+@pytest.fixture
+def gitops(temp_git_repo, _session_git_repo, _session_gitops):
+    """Shared GitOps instance with per-test state cleared.
+
+    Reusing the session instance skips the repo open + ref walk the
+    constructor does; the change memo is dropped here so a test never sees
+    the previous test's working-tree snapshot.
+    """
+    _, _, _, original_branch = _session_git_repo
+    _session_gitops._collect_cache = None
+    _session_gitops.original_branch = original_branch
+    return _session_gitops
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_color():
+    """Keep Rich/Click from embedding ANSI escapes in captured output.
+
+    Plain output keeps substring assertions scanning short strings and
+    makes failure diffs readable.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setenv("NO_COLOR", "1")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """One CliRunner for the whole session; the runner is stateless and
+    rebuilding it (plus its stdio capture plumbing) per test is wasted work."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
 
 
 @pytest.fixture
@@ -2,9 +2,8 @@
 Unit tests for redgit.core.gitops module.
 """
 
-import os
-import subprocess
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -12,9 +11,16 @@ from redgit.core.common.gitops import (
     GitOps,
     NotAGitRepoError,
     init_git_repo,
+    MAX_DIFF_LENGTH,
 )
 
 
+def _write_files(pairs):
+    """Write (path, content) pairs concurrently; writes release the GIL."""
+    with ThreadPoolExecutor() as ex:
+        list(ex.map(lambda p: p[0].write_text(p[1]), pairs))
+
+
 class TestInitGitRepo:
     """Tests for init_git_repo function."""
 
@@ -23,8 +29,8 @@ class TestInitGitRepo:
         repo = init_git_repo()
 
         assert (temp_dir / ".git").exists()
-        # Use Path.resolve() to handle symlinks on macOS
-        assert Path(repo.working_dir).resolve() == temp_dir.resolve()
+        # Fixture paths are pre-resolved, so only the repo side needs it
+        assert Path(repo.working_dir).resolve() == temp_dir
 
     def test_adds_remote_when_provided(self, temp_dir, change_cwd):
         """Test that remote is added when URL is provided."""
@@ -49,18 +55,14 @@ class TestGitOpsInit:
         assert (temp_dir / ".git").exists()
         assert gitops.repo is not None
 
-    def test_uses_existing_repo(self, temp_git_repo, change_cwd):
+    def test_uses_existing_repo(self, temp_git_repo, gitops):
         """Test that GitOps uses an existing git repository."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
-        # Use Path.resolve() to handle symlinks on macOS
-        assert Path(gitops.repo.working_dir).resolve() == temp_git_repo.resolve()
+        # Fixture paths are pre-resolved, so only the repo side needs it
+        assert Path(gitops.repo.working_dir).resolve() == temp_git_repo
 
-    def test_tracks_original_branch(self, temp_git_repo, change_cwd):
+    def test_tracks_original_branch(self, temp_git_repo, gitops):
         """Test that original branch is tracked."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Default branch after init is usually master or main
         assert gitops.original_branch in ["main", "master"]
@@ -69,67 +71,68 @@ class TestGitOpsInit:
 class TestGitOpsGetChanges:
     """Tests for GitOps.get_changes method."""
 
-    def test_returns_empty_list_when_no_changes(self, temp_git_repo, change_cwd):
+    def test_returns_empty_list_when_no_changes(self, temp_git_repo, gitops):
         """Test that empty list is returned when no changes."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         changes = gitops.get_changes()
 
         assert changes == []
 
-    def test_detects_new_file(self, temp_git_repo, change_cwd):
-        """Test that new untracked files are detected."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
-
-        # Create a new file
-        (temp_git_repo / "new_file.py").write_text("print('hello')")
-
-        changes = gitops.get_changes()
-
-        assert len(changes) == 1
-        assert changes[0]["file"] == "new_file.py"
-        assert changes[0]["status"] == "U"  # Untracked
-
-    def test_detects_modified_file(self, temp_git_repo, change_cwd):
-        """Test that modified files are detected."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
-
-        # Modify existing file
-        readme = temp_git_repo / "README.md"
-        readme.write_text("# Updated\n")
-
-        changes = gitops.get_changes()
-
-        assert len(changes) == 1
-        assert changes[0]["file"] == "README.md"
-        assert changes[0]["status"] == "M"  # Modified
-
-    def test_detects_deleted_file(self, temp_git_repo, change_cwd):
-        """Test that deleted files are detected."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
-
-        # Delete existing file
-        (temp_git_repo / "README.md").unlink()
-
-        changes = gitops.get_changes()
-
-        assert len(changes) == 1
-        assert changes[0]["file"] == "README.md"
-        assert changes[0]["status"] == "D"  # Deleted
-
-    def test_detects_staged_file(self, temp_git_repo, change_cwd):
+    @pytest.mark.parametrize(
+        ("setup", "include_excluded", "expected", "excluded"),
+        [
+            pytest.param(
+                lambda repo: (repo / "new_file.py").write_text("print('hello')"),
+                False, {"new_file.py": "U"}, set(),
+                id="new-file",
+            ),
+            pytest.param(
+                lambda repo: (repo / "README.md").write_text("# Updated\n"),
+                False, {"README.md": "M"}, set(),
+                id="modified-file",
+            ),
+            pytest.param(
+                lambda repo: (repo / "README.md").unlink(),
+                False, {"README.md": "D"}, set(),
+                id="deleted-file",
+            ),
+            pytest.param(
+                lambda repo: _write_files([
+                    (repo / ".env", "SECRET=value"),
+                    (repo / "normal.py", "print('normal')"),
+                ]),
+                False, {"normal.py": "U"}, {".env"},
+                id="excludes-sensitive",
+            ),
+            pytest.param(
+                lambda repo: (repo / ".env").write_text("SECRET=value"),
+                True, {".env": "U"}, set(),
+                id="includes-sensitive-when-requested",
+            ),
+        ],
+    )
+    def test_detects_changes(self, temp_git_repo, gitops, setup,
+                             include_excluded, expected, excluded):
+        """Test that new/modified/deleted files are detected and sensitive
+        files are excluded unless requested."""
+        setup(temp_git_repo)
+
+        changes = gitops.get_changes(include_excluded=include_excluded)
+
+        status_by_file = {c["file"]: c["status"] for c in changes}
+        assert len(changes) == len(expected)
+        for file, status in expected.items():
+            assert status_by_file.get(file) == status
+        for file in excluded:
+            assert file not in status_by_file
+
+    def test_detects_staged_file(self, temp_git_repo, gitops):
         """Test that staged files are detected."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create and stage a new file
         new_file = temp_git_repo / "staged.py"
         new_file.write_text("print('staged')")
-        subprocess.run(["git", "add", "staged.py"], cwd=temp_git_repo)
+        gitops.repo.index.add(["staged.py"])
 
         changes = gitops.get_changes()
 
@@ -139,34 +142,6 @@ class TestGitOpsGetChanges:
         assert staged_file is not None
         # The status depends on git implementation - just verify the file is found
 
-    def test_excludes_sensitive_files(self, temp_git_repo, change_cwd):
-        """Test that sensitive files are excluded by default."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
-
-        # Create sensitive and normal files
-        (temp_git_repo / ".env").write_text("SECRET=value")
-        (temp_git_repo / "normal.py").write_text("print('normal')")
-
-        changes = gitops.get_changes()
-
-        file_names = [c["file"] for c in changes]
-        assert "normal.py" in file_names
-        assert ".env" not in file_names
-
-    def test_includes_sensitive_when_requested(self, temp_git_repo, change_cwd):
-        """Test that sensitive files are included when requested."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
-
-        # Create sensitive file
-        (temp_git_repo / ".env").write_text("SECRET=value")
-
-        changes = gitops.get_changes(include_excluded=True)
-
-        file_names = [c["file"] for c in changes]
-        assert ".env" in file_names
-
 
 @pytest.mark.skip(reason="get_diff method not implemented in GitOps - TODO: implement")
 class TestGitOpsGetDiff:
@@ -188,19 +163,15 @@ class TestGitOpsGetDiff:
 class TestGitOpsBranchOperations:
     """Tests for GitOps branch operations."""
 
-    def test_create_branch(self, temp_git_repo, change_cwd):
+    def test_create_branch(self, temp_git_repo, gitops):
         """Test creating a new branch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         gitops.checkout_or_create_branch("feature/test")
 
         assert gitops.repo.active_branch.name == "feature/test"
 
-    def test_switch_to_existing_branch(self, temp_git_repo, change_cwd):
+    def test_switch_to_existing_branch(self, temp_git_repo, gitops):
         """Test switching to an existing branch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create branch first
         gitops.checkout_or_create_branch("feature/existing")
@@ -211,10 +182,8 @@ class TestGitOpsBranchOperations:
 
         assert gitops.repo.active_branch.name == "feature/existing"
 
-    def test_get_current_branch(self, temp_git_repo, change_cwd):
+    def test_get_current_branch(self, temp_git_repo, gitops):
         """Test getting current branch name via repo.active_branch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Use repo.active_branch.name directly
         branch = gitops.repo.active_branch.name
@@ -225,14 +194,14 @@ class TestGitOpsBranchOperations:
 class TestGitOpsCommitOperations:
     """Tests for GitOps commit operations."""
 
-    def test_stage_files(self, temp_git_repo, change_cwd):
+    def test_stage_files(self, temp_git_repo, gitops):
         """Test staging files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create new files
-        (temp_git_repo / "file1.py").write_text("# file 1")
-        (temp_git_repo / "file2.py").write_text("# file 2")
+        _write_files([
+            (temp_git_repo / "file1.py", "# file 1"),
+            (temp_git_repo / "file2.py", "# file 2"),
+        ])
 
         gitops.stage_files(["file1.py", "file2.py"])
 
@@ -242,49 +211,42 @@ class TestGitOpsCommitOperations:
         # After staging, check if they're in the index
         assert len(list(gitops.repo.index.entries)) > 0
 
-    def test_commit_creates_commit(self, temp_git_repo, change_cwd):
+    def test_commit_creates_commit(self, temp_git_repo, gitops):
         """Test that commit creates a new commit."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create and stage a file
         (temp_git_repo / "new.py").write_text("# new file")
-        subprocess.run(["git", "add", "new.py"], cwd=temp_git_repo)
+        gitops.repo.index.add(["new.py"])
 
-        # Get initial commit count
-        initial_count = len(list(gitops.repo.iter_commits()))
+        # Remember the current tip; parent linkage is an O(1) check,
+        # unlike materializing the whole history via iter_commits
+        before_sha = gitops.repo.head.commit.hexsha
 
         gitops.commit("test: add new file")
 
-        # Check commit was created
-        assert len(list(gitops.repo.iter_commits())) == initial_count + 1
+        # Check commit was created on top of the previous tip
+        assert gitops.repo.head.commit.parents[0].hexsha == before_sha
         assert gitops.repo.head.commit.message.startswith("test: add new file")
 
 
 class TestGitOpsRemoteOperations:
     """Tests for GitOps remote operations."""
 
-    def test_has_remote_false_when_no_remote(self, temp_git_repo, change_cwd):
+    def test_has_remote_false_when_no_remote(self, temp_git_repo, gitops):
         """Test repo.remotes is empty when no remote exists."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         assert len(gitops.repo.remotes) == 0
 
-    def test_has_remote_true_when_remote_exists(self, temp_git_repo, change_cwd):
+    def test_has_remote_true_when_remote_exists(self, temp_git_repo, gitops):
         """Test repo.remotes has items when remote exists."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Add a remote
         gitops.repo.create_remote("origin", "https://github.com/test/repo.git")
 
         assert len(gitops.repo.remotes) > 0
 
-    def test_get_remote_url(self, temp_git_repo, change_cwd):
+    def test_get_remote_url(self, temp_git_repo, gitops):
         """Test getting remote URL from repo.remotes."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Add a remote
         gitops.repo.create_remote("origin", "https://github.com/test/repo.git")
@@ -297,18 +259,16 @@ class TestGitOpsRemoteOperations:
 class TestGitOpsEdgeCases:
     """Tests for GitOps edge cases and error handling."""
 
-    def test_handles_empty_repo(self, temp_dir, change_cwd):
+    def test_handles_empty_repo(self, temp_dir, empty_gitops):
         """Test handling of empty repository (no commits)."""
-        gitops = GitOps(auto_init=True)
+        gitops = empty_gitops
 
         # Empty repo should not raise errors
         changes = gitops.get_changes()
         assert isinstance(changes, list)
 
-    def test_handles_binary_files(self, temp_git_repo, change_cwd):
+    def test_handles_binary_files(self, temp_git_repo, gitops):
         """Test handling of binary files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create a binary file
         binary_file = temp_git_repo / "image.png"
@@ -319,10 +279,8 @@ class TestGitOpsEdgeCases:
         assert len(changes) == 1
         assert changes[0]["file"] == "image.png"
 
-    def test_handles_special_characters_in_filename(self, temp_git_repo, change_cwd):
+    def test_handles_special_characters_in_filename(self, temp_git_repo, gitops):
         """Test handling of special characters in filenames."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create file with special characters (safe ones)
         special_file = temp_git_repo / "file-with_special.chars.py"
@@ -351,10 +309,8 @@ class TestNotAGitRepoError:
 class TestGitOpsGetExcludedChanges:
     """Tests for GitOps.get_excluded_changes method."""
 
-    def test_returns_empty_list_when_no_excluded(self, temp_git_repo, change_cwd):
+    def test_returns_empty_list_when_no_excluded(self, temp_git_repo, gitops):
         """Test returns empty list when no excluded files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create normal file
         (temp_git_repo / "normal.py").write_text("print('hello')")
@@ -362,10 +318,8 @@ class TestGitOpsGetExcludedChanges:
         excluded = gitops.get_excluded_changes()
         assert excluded == []
 
-    def test_detects_excluded_untracked_file(self, temp_git_repo, change_cwd):
+    def test_detects_excluded_untracked_file(self, temp_git_repo, gitops):
         """Test detects excluded untracked files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create excluded file
         (temp_git_repo / ".env").write_text("SECRET=value")
@@ -373,18 +327,16 @@ class TestGitOpsGetExcludedChanges:
         excluded = gitops.get_excluded_changes()
         assert ".env" in excluded
 
-    def test_detects_excluded_modified_file(self, temp_git_repo, change_cwd):
+    def test_detects_excluded_modified_file(self, temp_git_repo, gitops):
         """Test detects excluded modified files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create and commit an excluded file first (for testing modified)
         redgit_dir = temp_git_repo / ".redgit"
         redgit_dir.mkdir()
         config_file = redgit_dir / "config.yaml"
         config_file.write_text("test: value")
-        subprocess.run(["git", "add", ".redgit/config.yaml"], cwd=temp_git_repo)
-        subprocess.run(["git", "commit", "-m", "add config"], cwd=temp_git_repo)
+        gitops.repo.index.add([".redgit/config.yaml"])
+        gitops.repo.index.commit("add config")
 
         # Modify the excluded file
         config_file.write_text("test: new_value")
@@ -396,16 +348,14 @@ class TestGitOpsGetExcludedChanges:
 class TestGitOpsHasCommits:
     """Tests for GitOps.has_commits method."""
 
-    def test_returns_false_for_empty_repo(self, temp_dir, change_cwd):
+    def test_returns_false_for_empty_repo(self, temp_dir, empty_gitops):
         """Test returns False for repo with no commits."""
-        gitops = GitOps(auto_init=True)
+        gitops = empty_gitops
 
         assert gitops.has_commits() is False
 
-    def test_returns_true_for_repo_with_commits(self, temp_git_repo, change_cwd):
+    def test_returns_true_for_repo_with_commits(self, temp_git_repo, gitops):
         """Test returns True for repo with commits."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         assert gitops.has_commits() is True
 
@@ -413,10 +363,8 @@ class TestGitOpsHasCommits:
 class TestGitOpsGetDiffsForFiles:
     """Tests for GitOps.get_diffs_for_files method."""
 
-    def test_returns_diff_for_modified_file(self, temp_git_repo, change_cwd):
+    def test_returns_diff_for_modified_file(self, temp_git_repo, gitops):
         """Test returns diff for modified files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Modify existing file
         readme = temp_git_repo / "README.md"
@@ -427,10 +375,8 @@ class TestGitOpsGetDiffsForFiles:
         assert "README.md" in diffs
         assert "Modified" in diffs or "---" in diffs or "+++" in diffs
 
-    def test_returns_content_for_new_file(self, temp_git_repo, change_cwd):
+    def test_returns_content_for_new_file(self, temp_git_repo, gitops):
         """Test returns content for new untracked files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create new file
         new_file = temp_git_repo / "new_file.py"
@@ -441,75 +387,66 @@ class TestGitOpsGetDiffsForFiles:
         assert "new_file.py" in diffs
         assert "new file" in diffs or "hello world" in diffs
 
-    def test_returns_staged_diff(self, temp_git_repo, change_cwd):
+    def test_returns_staged_diff(self, temp_git_repo, gitops):
         """Test returns diff for staged files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Modify and stage file
         readme = temp_git_repo / "README.md"
         readme.write_text("# Staged Changes\n")
-        subprocess.run(["git", "add", "README.md"], cwd=temp_git_repo)
+        gitops.repo.index.add(["README.md"])
 
         diffs = gitops.get_diffs_for_files(["README.md"])
 
         assert "README.md" in diffs
 
-    def test_handles_nonexistent_file(self, temp_git_repo, change_cwd):
+    def test_handles_nonexistent_file(self, temp_git_repo, gitops):
         """Test handles non-existent files gracefully."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         diffs = gitops.get_diffs_for_files(["nonexistent.py"])
 
         # Should return empty or not crash
         assert isinstance(diffs, str)
 
-    def test_combines_multiple_files(self, temp_git_repo, change_cwd):
+    def test_combines_multiple_files(self, temp_git_repo, gitops):
         """Test combines diffs from multiple files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create multiple files
-        (temp_git_repo / "file1.py").write_text("# file 1")
-        (temp_git_repo / "file2.py").write_text("# file 2")
+        _write_files([
+            (temp_git_repo / "file1.py", "# file 1"),
+            (temp_git_repo / "file2.py", "# file 2"),
+        ])
 
         diffs = gitops.get_diffs_for_files(["file1.py", "file2.py"])
 
         assert "file1.py" in diffs
         assert "file2.py" in diffs
 
-    def test_truncates_large_files(self, temp_git_repo, change_cwd):
+    def test_truncates_large_files(self, temp_git_repo, gitops):
         """Test truncates very large files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
-        # Create large file
+        # Create a file just past the truncation threshold; bytes I/O skips
+        # the text-encoding pass and the real limit documents the intent
         large_file = temp_git_repo / "large.py"
-        large_file.write_text("x" * 5000)
+        large_file.write_bytes(b"x" * (MAX_DIFF_LENGTH + 1))
 
         diffs = gitops.get_diffs_for_files(["large.py"])
 
         # Should contain truncation message or be truncated
-        assert len(diffs) < 5000 or "truncated" in diffs
+        assert "truncated" in diffs
 
 
 class TestGitOpsRemoteBranchExists:
     """Tests for GitOps.remote_branch_exists method."""
 
-    def test_returns_false_when_no_remote(self, temp_git_repo, change_cwd):
+    def test_returns_false_when_no_remote(self, temp_git_repo, gitops):
         """Test returns False when no remote exists."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         result = gitops.remote_branch_exists("main")
 
         assert result is False
 
-    def test_returns_false_for_nonexistent_branch(self, temp_git_repo, change_cwd):
+    def test_returns_false_for_nonexistent_branch(self, temp_git_repo, gitops):
         """Test returns False for non-existent remote branch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
         gitops.repo.create_remote("origin", "https://github.com/test/repo.git")
 
         result = gitops.remote_branch_exists("nonexistent-branch")
@@ -520,17 +457,15 @@ class TestGitOpsRemoteBranchExists:
 class TestGitOpsMergeBranch:
     """Tests for GitOps.merge_branch method."""
 
-    def test_merge_success(self, temp_git_repo, change_cwd):
+    def test_merge_success(self, temp_git_repo, gitops):
         """Test successful branch merge."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
         original = gitops.original_branch
 
         # Create feature branch with a commit
         gitops.repo.git.checkout("-b", "feature/merge-test")
         (temp_git_repo / "feature.py").write_text("# feature")
-        subprocess.run(["git", "add", "feature.py"], cwd=temp_git_repo)
-        subprocess.run(["git", "commit", "-m", "add feature"], cwd=temp_git_repo)
+        gitops.repo.index.add(["feature.py"])
+        gitops.repo.index.commit("add feature")
 
         # Go back to original
         gitops.repo.git.checkout(original)
@@ -544,17 +479,15 @@ class TestGitOpsMergeBranch:
         branches = [b.name for b in gitops.repo.branches]
         assert "feature/merge-test" not in branches
 
-    def test_merge_keeps_branch_when_requested(self, temp_git_repo, change_cwd):
+    def test_merge_keeps_branch_when_requested(self, temp_git_repo, gitops):
         """Test merge keeps branch when delete_source=False."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
         original = gitops.original_branch
 
         # Create feature branch with a commit
         gitops.repo.git.checkout("-b", "feature/keep-me")
         (temp_git_repo / "keep.py").write_text("# keep")
-        subprocess.run(["git", "add", "keep.py"], cwd=temp_git_repo)
-        subprocess.run(["git", "commit", "-m", "add keep"], cwd=temp_git_repo)
+        gitops.repo.index.add(["keep.py"])
+        gitops.repo.index.commit("add keep")
 
         # Go back to original
         gitops.repo.git.checkout(original)
@@ -571,10 +504,8 @@ class TestGitOpsMergeBranch:
 class TestGitOpsCreateBranchAndCommit:
     """Tests for GitOps.create_branch_and_commit method."""
 
-    def test_creates_branch_and_commits(self, temp_git_repo, change_cwd):
+    def test_creates_branch_and_commits(self, temp_git_repo, gitops):
         """Test creates branch and commits files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create file
         (temp_git_repo / "feature.py").write_text("# feature")
@@ -590,10 +521,8 @@ class TestGitOpsCreateBranchAndCommit:
         # Should be back on original branch
         assert gitops.repo.active_branch.name == gitops.original_branch
 
-    def test_excludes_sensitive_files(self, temp_git_repo, change_cwd):
+    def test_excludes_sensitive_files(self, temp_git_repo, gitops):
         """Test excludes sensitive files from commit."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create files
         (temp_git_repo / "feature.py").write_text("# feature")
@@ -608,15 +537,13 @@ class TestGitOpsCreateBranchAndCommit:
 
         assert success is True
 
-    def test_handles_deleted_files(self, temp_git_repo, change_cwd):
+    def test_handles_deleted_files(self, temp_git_repo, gitops):
         """Test handles deleted files in commit."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create and commit a file first
         (temp_git_repo / "to_delete.py").write_text("# delete me")
-        subprocess.run(["git", "add", "to_delete.py"], cwd=temp_git_repo)
-        subprocess.run(["git", "commit", "-m", "add file"], cwd=temp_git_repo)
+        gitops.repo.index.add(["to_delete.py"])
+        gitops.repo.index.commit("add file")
 
         # Delete the file
         (temp_git_repo / "to_delete.py").unlink()
@@ -630,10 +557,8 @@ class TestGitOpsCreateBranchAndCommit:
 
         assert success is True
 
-    def test_returns_false_when_no_files(self, temp_git_repo, change_cwd):
+    def test_returns_false_when_no_files(self, temp_git_repo, gitops):
         """Test returns False when no valid files to commit."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Try to commit only excluded files
         success = gitops.create_branch_and_commit(
@@ -644,10 +569,8 @@ class TestGitOpsCreateBranchAndCommit:
 
         assert success is False
 
-    def test_merge_request_strategy_keeps_branch(self, temp_git_repo, change_cwd):
+    def test_merge_request_strategy_keeps_branch(self, temp_git_repo, gitops):
         """Test merge-request strategy keeps branch for later."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create file
         (temp_git_repo / "feature.py").write_text("# feature")
@@ -669,10 +592,8 @@ class TestGitOpsCreateBranchAndCommit:
 class TestGitOpsCheckoutOrCreateBranch:
     """Tests for GitOps.checkout_or_create_branch method."""
 
-    def test_creates_new_branch(self, temp_git_repo, change_cwd):
+    def test_creates_new_branch(self, temp_git_repo, gitops):
         """Test creates new branch when doesn't exist."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         success, is_new, error = gitops.checkout_or_create_branch("feature/new")
 
@@ -681,10 +602,8 @@ class TestGitOpsCheckoutOrCreateBranch:
         assert error is None
         assert gitops.repo.active_branch.name == "feature/new"
 
-    def test_switches_to_existing_local_branch(self, temp_git_repo, change_cwd):
+    def test_switches_to_existing_local_branch(self, temp_git_repo, gitops):
         """Test switches to existing local branch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
         original = gitops.original_branch
 
         # Create branch
@@ -698,10 +617,8 @@ class TestGitOpsCheckoutOrCreateBranch:
         assert is_new is False
         assert error is None
 
-    def test_preserves_changes_during_switch(self, temp_git_repo, change_cwd):
+    def test_preserves_changes_during_switch(self, temp_git_repo, gitops):
         """Test preserves uncommitted changes during branch switch."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create uncommitted change
         (temp_git_repo / "uncommitted.py").write_text("# uncommitted")
@@ -716,9 +633,9 @@ class TestGitOpsCheckoutOrCreateBranch:
 class TestGitOpsCommitToEmptyRepo:
     """Tests for GitOps._commit_to_empty_repo method."""
 
-    def test_commits_to_empty_repo(self, temp_dir, change_cwd):
+    def test_commits_to_empty_repo(self, temp_dir, empty_gitops):
         """Test commits to empty repo directly."""
-        gitops = GitOps(auto_init=True)
+        gitops = empty_gitops
 
         # Create file
         (temp_dir / "initial.py").write_text("# initial")
@@ -734,9 +651,9 @@ class TestGitOpsCommitToEmptyRepo:
         assert success is True
         assert gitops.has_commits() is True
 
-    def test_updates_original_branch_after_commit(self, temp_dir, change_cwd):
+    def test_updates_original_branch_after_commit(self, temp_dir, empty_gitops):
         """Test updates original_branch after first commit."""
-        gitops = GitOps(auto_init=True)
+        gitops = empty_gitops
 
         # Create file
         (temp_dir / "initial.py").write_text("# initial")
@@ -756,10 +673,8 @@ class TestGitOpsCommitToEmptyRepo:
 class TestGitOpsCreateSubtaskBranchAndCommit:
     """Tests for GitOps.create_subtask_branch_and_commit method."""
 
-    def test_creates_subtask_and_merges(self, temp_git_repo, change_cwd):
+    def test_creates_subtask_and_merges(self, temp_git_repo, gitops):
         """Test creates subtask branch and merges back to parent."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create parent branch first (using - instead of / to avoid git ref conflicts)
         gitops.repo.git.checkout("-b", "feature-parent-task")
@@ -782,10 +697,8 @@ class TestGitOpsCreateSubtaskBranchAndCommit:
         branches = [b.name for b in gitops.repo.branches]
         assert "subtask-1-of-parent" not in branches
 
-    def test_excludes_sensitive_files(self, temp_git_repo, change_cwd):
+    def test_excludes_sensitive_files(self, temp_git_repo, gitops):
         """Test excludes sensitive files from subtask commit."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create parent branch
         gitops.repo.git.checkout("-b", "parent-task")
@@ -803,10 +716,8 @@ class TestGitOpsCreateSubtaskBranchAndCommit:
 
         assert success is True
 
-    def test_returns_false_when_no_files(self, temp_git_repo, change_cwd):
+    def test_returns_false_when_no_files(self, temp_git_repo, gitops):
         """Test returns False when no valid files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create parent branch
         gitops.repo.git.checkout("-b", "parent-task-2")
@@ -824,10 +735,8 @@ class TestGitOpsCreateSubtaskBranchAndCommit:
 class TestGitOpsStageFilesExcluded:
     """Tests for stage_files with excluded files."""
 
-    def test_returns_excluded_files(self, temp_git_repo, change_cwd):
+    def test_returns_excluded_files(self, temp_git_repo, gitops):
         """Test returns list of excluded files."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         # Create files
         (temp_git_repo / "normal.py").write_text("# normal")
@@ -838,10 +747,8 @@ class TestGitOpsStageFilesExcluded:
         assert "normal.py" in staged
         assert ".env" in excluded
 
-    def test_skips_nonexistent_files(self, temp_git_repo, change_cwd):
+    def test_skips_nonexistent_files(self, temp_git_repo, gitops):
         """Test skips files that don't exist."""
-        os.chdir(temp_git_repo)
-        gitops = GitOps()
 
         staged, excluded = gitops.stage_files(["nonexistent.py"])
 
@@ -1,96 +1,132 @@
 """Tests for integration command module."""
 
+import ast
+import contextlib
+import itertools
 import pytest
 import json
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch, call
-from typer.testing import CliRunner
 import typer
 
-from redgit.commands.integration import (
-    _get_integration_type_name,
-    _get_integration_type_label,
-    _get_installed_integrations,
-    _is_configured,
-    _get_field_key,
-    _prompt_field,
-    _generate_init_py,
-    _generate_commands_py,
-    _generate_install_schema,
-    _generate_readme,
-    _generate_prompt_analyze,
-    _generate_prompt_summarize,
-    _generate_prompt_custom,
-    configure_integration,
-    integration_app,
-    INTEGRATION_TYPES,
-)
-from redgit.integrations.registry import IntegrationType
-
-
-runner = CliRunner()
+# IntegrationType is defined in the stdlib-only base module; importing it
+# from there keeps collection from pulling in the registry's import chain.
+from redgit.integrations.base import IntegrationType
 
 
-# ==================== Tests for _get_integration_type_name ====================
+@pytest.fixture(scope="session")
+def cmd_mod():
+    """The module under test, imported once per session.
 
-class TestGetIntegrationTypeName:
-    """Tests for _get_integration_type_name helper."""
+    Importing redgit.commands.integration pulls in Typer, the integrations
+    registry, and the template machinery; deferring it keeps collection-only
+    and -k filtered runs that skip these tests from paying that import.
+    """
+    import redgit.commands.integration as m
+    return m
 
-    def test_task_management(self):
-        """Returns correct name for task management type."""
-        result = _get_integration_type_name(IntegrationType.TASK_MANAGEMENT)
-        assert result == "task_management"
 
-    def test_code_hosting(self):
-        """Returns correct name for code hosting type."""
-        result = _get_integration_type_name(IntegrationType.CODE_HOSTING)
-        assert result == "code_hosting"
+# Shared read-only config samples for the CLI tests. MappingProxyType makes
+# any accidental in-place mutation by the command under test a TypeError, so
+# tests that write to the loaded config keep building their own literals.
+_JIRA_ENABLED = MappingProxyType({
+    "integrations": MappingProxyType({"jira": MappingProxyType({"enabled": True})})
+})
+_NO_INTEGRATIONS = MappingProxyType({"integrations": MappingProxyType({})})
 
-    def test_notification(self):
-        """Returns correct name for notification type."""
-        result = _get_integration_type_name(IntegrationType.NOTIFICATION)
-        assert result == "notification"
+# Dict-value stand-in for registry entries whose identity is never inspected.
+_SENTINEL = object()
 
-    def test_analysis(self):
-        """Returns correct name for analysis type."""
-        result = _get_integration_type_name(IntegrationType.ANALYSIS)
-        assert result == "analysis"
+# Registry / schema constants shared across the configure tests; read-only
+# like the config samples above.
+_INTEG_JIRA = MappingProxyType({"jira": _SENTINEL})
+_INTEG_SIMPLE = MappingProxyType({"simple": _SENTINEL})
+_JIRA_SCHEMA = MappingProxyType({
+    "name": "Jira",
+    "fields": (
+        MappingProxyType({"key": "api_key", "required": True}),
+        MappingProxyType({"key": "base_url", "required": False}),
+    ),
+})
 
-    def test_unknown_type(self):
-        """Returns 'unknown' for unrecognized type."""
-        result = _get_integration_type_name(None)
-        assert result == "unknown"
 
+class FakeConfigManager:
+    """Minimal ConfigManager stand-in for the CLI tests.
 
-# ==================== Tests for _get_integration_type_label ====================
+    Plain attribute access instead of MagicMock's lazy child-mock
+    machinery; save assertions read `fake.saved` rather than digging
+    through call_args.
+    """
+
+    def __init__(self, data=None):
+        self._data = data if data is not None else {}
+        self.saved = None
+
+    def load(self):
+        return self._data
+
+    def save(self, data):
+        self.saved = data
+
+
+@contextlib.contextmanager
+def fake_config(data=None):
+    """Patch the integration command module's ConfigManager with a fake."""
+    fake = FakeConfigManager(data)
+    with patch('redgit.commands.integration.ConfigManager', return_value=fake):
+        yield fake
+
+
+@pytest.fixture(scope="module")
+def _project_base(tmp_path_factory):
+    """One real temp root per module; tests carve numbered subdirs off it."""
+    return tmp_path_factory.mktemp("proj")
+
+
+_project_seq = itertools.count()
 
-class TestGetIntegrationTypeLabel:
-    """Tests for _get_integration_type_label helper."""
 
-    def test_task_management_label(self):
-        """Returns correct label for task management type."""
-        result = _get_integration_type_label(IntegrationType.TASK_MANAGEMENT)
-        assert result == "Task Management"
+@pytest.fixture
+def redgit_root(_project_base, monkeypatch):
+    """A project dir containing .redgit, with cwd moved into it.
 
-    def test_code_hosting_label(self):
-        """Returns correct label for code hosting type."""
-        result = _get_integration_type_label(IntegrationType.CODE_HOSTING)
-        assert result == "Code Hosting"
+    Cheaper than tmp_path for the create/update tests: one mkdir pass in
+    an already-created base instead of pytest's numbered-dir management
+    per test.
+    """
+    root = _project_base / f"t{next(_project_seq)}"
+    (root / ".redgit").mkdir(parents=True)
+    monkeypatch.chdir(root)
+    return root
 
-    def test_notification_label(self):
-        """Returns correct label for notification type."""
-        result = _get_integration_type_label(IntegrationType.NOTIFICATION)
-        assert result == "Notification"
 
-    def test_analysis_label(self):
-        """Returns correct label for analysis type."""
-        result = _get_integration_type_label(IntegrationType.ANALYSIS)
-        assert result == "Analysis"
+# ==================== Tests for _get_integration_type_name ====================
+
+@pytest.mark.parametrize("itype,expected", [
+    (IntegrationType.TASK_MANAGEMENT, "task_management"),
+    (IntegrationType.CODE_HOSTING, "code_hosting"),
+    (IntegrationType.NOTIFICATION, "notification"),
+    (IntegrationType.ANALYSIS, "analysis"),
+    (None, "unknown"),
+])
+def test_get_integration_type_name(itype, expected, cmd_mod):
+    """Returns the snake_case name per type, 'unknown' for unrecognized."""
+    assert cmd_mod._get_integration_type_name(itype) == expected
+
 
-    def test_unknown_type_label(self):
-        """Returns 'Unknown' for unrecognized type."""
-        result = _get_integration_type_label(None)
-        assert result == "Unknown"
+# ==================== Tests for _get_integration_type_label ====================
+
+@pytest.mark.parametrize("itype,expected", [
+    (IntegrationType.TASK_MANAGEMENT, "Task Management"),
+    (IntegrationType.CODE_HOSTING, "Code Hosting"),
+    (IntegrationType.NOTIFICATION, "Notification"),
+    (IntegrationType.ANALYSIS, "Analysis"),
+    (None, "Unknown"),
+])
+def test_get_integration_type_label(itype, expected, cmd_mod):
+    """Returns the display label per type, 'Unknown' for unrecognized."""
+    assert cmd_mod._get_integration_type_label(itype) == expected
 
 
 # ==================== Tests for _get_installed_integrations ====================
@@ -98,18 +134,15 @@ class TestGetIntegrationTypeLabel:
 class TestGetInstalledIntegrations:
     """Tests for _get_installed_integrations helper."""
 
-    def test_empty_directories(self, tmp_path, monkeypatch):
+    def test_empty_directories(self, tmp_path, cmd_mod):
         """Returns empty set when no integrations installed."""
-        monkeypatch.chdir(tmp_path)
-
         with patch('redgit.core.common.config.GLOBAL_INTEGRATIONS_DIR', tmp_path / "global"):
-            result = _get_installed_integrations()
+            result = cmd_mod._get_installed_integrations(base_dir=tmp_path)
 
         assert result == set()
 
-    def test_global_integrations(self, tmp_path, monkeypatch):
+    def test_global_integrations(self, tmp_path, cmd_mod):
         """Finds integrations in global directory."""
-        monkeypatch.chdir(tmp_path)
         global_dir = tmp_path / "global"
 
         # Create global integration
@@ -118,40 +151,35 @@ class TestGetInstalledIntegrations:
         (integration_dir / "__init__.py").write_text("# integration")
 
         with patch('redgit.core.common.config.GLOBAL_INTEGRATIONS_DIR', global_dir):
-            result = _get_installed_integrations()
+            result = cmd_mod._get_installed_integrations(base_dir=tmp_path)
 
         assert "my_integration" in result
 
-    def test_project_integrations(self, tmp_path, monkeypatch):
+    def test_project_integrations(self, tmp_path, cmd_mod):
         """Finds integrations in project directory."""
-        monkeypatch.chdir(tmp_path)
-
         # Create project integration
         integration_dir = tmp_path / ".redgit" / "integrations" / "local_integration"
         integration_dir.mkdir(parents=True)
         (integration_dir / "__init__.py").write_text("# integration")
 
         with patch('redgit.core.common.config.GLOBAL_INTEGRATIONS_DIR', tmp_path / "nonexistent"):
-            result = _get_installed_integrations()
+            result = cmd_mod._get_installed_integrations(base_dir=tmp_path)
 
         assert "local_integration" in result
 
-    def test_ignores_non_package_dirs(self, tmp_path, monkeypatch):
+    def test_ignores_non_package_dirs(self, tmp_path, cmd_mod):
         """Ignores directories without __init__.py."""
-        monkeypatch.chdir(tmp_path)
-
         # Create project directory without __init__.py
         integration_dir = tmp_path / ".redgit" / "integrations" / "not_a_package"
         integration_dir.mkdir(parents=True)
 
         with patch('redgit.core.common.config.GLOBAL_INTEGRATIONS_DIR', tmp_path / "nonexistent"):
-            result = _get_installed_integrations()
+            result = cmd_mod._get_installed_integrations(base_dir=tmp_path)
 
         assert "not_a_package" not in result
 
-    def test_combines_global_and_project(self, tmp_path, monkeypatch):
+    def test_combines_global_and_project(self, tmp_path, cmd_mod):
         """Combines integrations from both global and project directories."""
-        monkeypatch.chdir(tmp_path)
         global_dir = tmp_path / "global"
 
         # Create global integration
@@ -165,7 +193,7 @@ class TestGetInstalledIntegrations:
         (project_int_dir / "__init__.py").write_text("# project")
 
         with patch('redgit.core.common.config.GLOBAL_INTEGRATIONS_DIR', global_dir):
-            result = _get_installed_integrations()
+            result = cmd_mod._get_installed_integrations(base_dir=tmp_path)
 
         assert "global_int" in result
         assert "project_int" in result
@@ -173,96 +201,51 @@ class TestGetInstalledIntegrations:
 
 # ==================== Tests for _is_configured ====================
 
-class TestIsConfigured:
-    """Tests for _is_configured helper."""
-
-    def test_disabled_integration(self):
-        """Returns False for disabled integration."""
-        config = {"enabled": False}
-        schema = {}
-
-        assert _is_configured(config, schema) is False
-
-    def test_no_required_fields(self):
-        """Returns True when no required fields and enabled."""
-        config = {"enabled": True}
-        schema = {"fields": []}
-
-        assert _is_configured(config, schema) is True
-
-    def test_all_required_fields_present(self):
-        """Returns True when all required fields are present."""
-        config = {
-            "enabled": True,
-            "api_key": "secret123",
-            "base_url": "https://api.example.com"
-        }
-        schema = {
-            "fields": [
-                {"key": "api_key", "required": True},
-                {"key": "base_url", "required": True}
-            ]
-        }
-
-        assert _is_configured(config, schema) is True
-
-    def test_missing_required_field(self):
-        """Returns False when required field is missing."""
-        config = {
-            "enabled": True,
-            "api_key": "secret123"
-        }
-        schema = {
-            "fields": [
-                {"key": "api_key", "required": True},
-                {"key": "base_url", "required": True}
-            ]
-        }
-
-        assert _is_configured(config, schema) is False
-
-    def test_empty_required_field(self):
-        """Returns False when required field is empty."""
-        config = {
-            "enabled": True,
-            "api_key": ""
-        }
-        schema = {
-            "fields": [
-                {"key": "api_key", "required": True}
-            ]
-        }
-
-        assert _is_configured(config, schema) is False
-
-    def test_optional_fields_not_required(self):
-        """Returns True when optional fields are missing."""
-        config = {
-            "enabled": True,
-            "api_key": "secret123"
-        }
-        schema = {
-            "fields": [
-                {"key": "api_key", "required": True},
-                {"key": "optional_field", "required": False}
-            ]
-        }
-
-        assert _is_configured(config, schema) is True
-
-    def test_uses_name_as_fallback_key(self):
-        """Uses 'name' field if 'key' is not present."""
-        config = {
-            "enabled": True,
-            "token": "abc123"
-        }
-        schema = {
-            "fields": [
-                {"name": "token", "required": True}
-            ]
-        }
-
-        assert _is_configured(config, schema) is True
+@pytest.mark.parametrize("config,schema,expected", [
+    pytest.param(
+        {"enabled": False}, {}, False,
+        id="disabled"),
+    pytest.param(
+        {"enabled": True}, {"fields": []}, True,
+        id="no-required-fields"),
+    pytest.param(
+        {"enabled": True, "api_key": "secret123", "base_url": "https://api.example.com"},
+        {"fields": [
+            {"key": "api_key", "required": True},
+            {"key": "base_url", "required": True},
+        ]},
+        True,
+        id="all-required-present"),
+    pytest.param(
+        {"enabled": True, "api_key": "secret123"},
+        {"fields": [
+            {"key": "api_key", "required": True},
+            {"key": "base_url", "required": True},
+        ]},
+        False,
+        id="missing-required"),
+    pytest.param(
+        {"enabled": True, "api_key": ""},
+        {"fields": [{"key": "api_key", "required": True}]},
+        False,
+        id="empty-required"),
+    pytest.param(
+        {"enabled": True, "api_key": "secret123"},
+        {"fields": [
+            {"key": "api_key", "required": True},
+            {"key": "optional_field", "required": False},
+        ]},
+        True,
+        id="optional-missing-ok"),
+    pytest.param(
+        {"enabled": True, "token": "abc123"},
+        {"fields": [{"name": "token", "required": True}]},
+        True,
+        id="name-fallback-key"),
+])
+def test_is_configured(config, schema, expected, cmd_mod):
+    """_is_configured truth table over enabled flag and required fields."""
+    assert cmd_mod._is_configured(config, schema) is expected
 
 
 # ==================== Tests for _get_field_key ====================
@@ -270,20 +253,20 @@ class TestIsConfigured:
 class TestGetFieldKey:
     """Tests for _get_field_key helper."""
 
-    def test_uses_key_first(self):
+    def test_uses_key_first(self, cmd_mod):
         """Prefers 'key' over 'name'."""
         field = {"key": "api_key", "name": "token"}
-        assert _get_field_key(field) == "api_key"
+        assert cmd_mod._get_field_key(field) == "api_key"
 
-    def test_falls_back_to_name(self):
+    def test_falls_back_to_name(self, cmd_mod):
         """Uses 'name' if 'key' not present."""
         field = {"name": "token"}
-        assert _get_field_key(field) == "token"
+        assert cmd_mod._get_field_key(field) == "token"
 
-    def test_returns_empty_string_if_no_key_or_name(self):
+    def test_returns_empty_string_if_no_key_or_name(self, cmd_mod):
         """Returns empty string if neither 'key' nor 'name' present."""
         field = {"type": "text"}
-        assert _get_field_key(field) == ""
+        assert cmd_mod._get_field_key(field) == ""
 
 
 # ==================== Tests for _prompt_field ====================
@@ -291,132 +274,92 @@ class TestGetFieldKey:
 class TestPromptField:
     """Tests for _prompt_field helper."""
 
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_text_field_with_default(self, mock_echo, mock_prompt):
-        """Prompts for text field with default value."""
-        mock_prompt.return_value = "my_value"
-        field = {
-            "key": "name",
-            "prompt": "Enter name",
-            "type": "text",
-            "default": "default_name"
-        }
-
-        result = _prompt_field(field)
-
-        assert result == "my_value"
-        mock_prompt.assert_called_with("   Enter name", default="default_name")
-
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_text_field_required(self, mock_echo, mock_prompt):
-        """Prompts for required text field without default."""
-        mock_prompt.return_value = "required_value"
-        field = {
-            "key": "api_key",
-            "prompt": "API Key",
-            "type": "text",
-            "required": True
-        }
-
-        result = _prompt_field(field)
-
-        assert result == "required_value"
-        mock_prompt.assert_called_with("   API Key")
-
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_text_field_optional(self, mock_echo, mock_prompt):
-        """Prompts for optional text field."""
-        mock_prompt.return_value = ""
-        field = {
-            "key": "optional",
-            "prompt": "Optional field",
-            "type": "text",
-            "required": False
-        }
-
-        result = _prompt_field(field)
-
-        assert result is None
-        mock_prompt.assert_called_with("   Optional field (optional)", default="")
-
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_secret_field_required(self, mock_echo, mock_prompt):
-        """Prompts for required secret field with hidden input."""
-        mock_prompt.return_value = "secret123"
-        field = {
-            "key": "password",
-            "prompt": "Password",
-            "type": "secret",
-            "required": True
-        }
-
-        result = _prompt_field(field)
-
-        assert result == "secret123"
-        mock_prompt.assert_called_with("   Password", hide_input=True)
-
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_secret_field_optional(self, mock_echo, mock_prompt):
-        """Prompts for optional secret field."""
-        mock_prompt.return_value = ""
-        field = {
-            "key": "optional_secret",
-            "prompt": "Optional Secret",
-            "type": "secret",
-            "required": False
-        }
-
-        result = _prompt_field(field)
-
-        assert result is None
-        mock_prompt.assert_called_with(
-            "   Optional Secret (optional, press Enter to skip)",
-            hide_input=True,
-            default=""
+    @pytest.fixture(autouse=True)
+    def _silence_echo(self, monkeypatch):
+        """No test here asserts on the echoed field headers, so echo is a
+        no-op by default; the help/env-hint tests install their own mock
+        on top of this."""
+        monkeypatch.setattr(
+            "redgit.commands.integration.typer.echo", lambda *a, **k: None
         )
 
+    @pytest.mark.parametrize(
+        ("field", "prompt_return", "expected", "expected_prompt_call"),
+        [
+            pytest.param(
+                {"key": "name", "prompt": "Enter name", "type": "text",
+                 "default": "default_name"},
+                "my_value", "my_value",
+                call("   Enter name", default="default_name"),
+                id="text-with-default",
+            ),
+            pytest.param(
+                {"key": "api_key", "prompt": "API Key", "type": "text",
+                 "required": True},
+                "required_value", "required_value",
+                call("   API Key"),
+                id="text-required",
+            ),
+            pytest.param(
+                {"key": "optional", "prompt": "Optional field", "type": "text",
+                 "required": False},
+                "", None,
+                call("   Optional field (optional)", default=""),
+                id="text-optional",
+            ),
+            pytest.param(
+                {"key": "password", "prompt": "Password", "type": "secret",
+                 "required": True},
+                "secret123", "secret123",
+                call("   Password", hide_input=True),
+                id="secret-required",
+            ),
+            pytest.param(
+                {"key": "optional_secret", "prompt": "Optional Secret",
+                 "type": "secret", "required": False},
+                "", None,
+                call("   Optional Secret (optional, press Enter to skip)",
+                     hide_input=True, default=""),
+                id="secret-optional",
+            ),
+            pytest.param(
+                {"key": "env", "prompt": "Environment", "type": "choice",
+                 "choices": ["development", "staging", "production"],
+                 "default": "development"},
+                "2", "staging",  # Index 1 (choice "2")
+                None,
+                id="choice",
+            ),
+            pytest.param(
+                {"key": "env", "prompt": "Environment", "type": "choice",
+                 "choices": ["dev", "prod"], "default": "dev"},
+                "invalid", "dev",  # Falls back to default
+                None,
+                id="choice-invalid-input",
+            ),
+            pytest.param(
+                {"key": "name", "prompt": "Name", "type": "string",  # Treated as "text"
+                 "required": True},
+                "value", "value",
+                None,
+                id="string-normalized-to-text",
+            ),
+        ],
+    )
     @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_choice_field(self, mock_echo, mock_prompt):
-        """Prompts for choice field."""
-        mock_prompt.return_value = "2"
-        field = {
-            "key": "env",
-            "prompt": "Environment",
-            "type": "choice",
-            "choices": ["development", "staging", "production"],
-            "default": "development"
-        }
-
-        result = _prompt_field(field)
+    def test_prompt_based_fields(self, mock_prompt, field,
+                                 prompt_return, expected, expected_prompt_call, cmd_mod):
+        """Prompts for text/secret/choice fields with the right arguments."""
+        mock_prompt.return_value = prompt_return
 
-        assert result == "staging"  # Index 1 (choice "2")
-
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_choice_field_invalid_input(self, mock_echo, mock_prompt):
-        """Returns default for invalid choice input."""
-        mock_prompt.return_value = "invalid"
-        field = {
-            "key": "env",
-            "prompt": "Environment",
-            "type": "choice",
-            "choices": ["dev", "prod"],
-            "default": "dev"
-        }
+        result = cmd_mod._prompt_field(field)
 
-        result = _prompt_field(field)
-
-        assert result == "dev"  # Falls back to default
+        assert result == expected
+        if expected_prompt_call is not None:
+            assert mock_prompt.call_args == expected_prompt_call
 
     @patch('redgit.commands.integration.typer.confirm')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_confirm_field(self, mock_echo, mock_confirm):
+    def test_confirm_field(self, mock_confirm, cmd_mod):
         """Prompts for confirmation field."""
         mock_confirm.return_value = True
         field = {
@@ -426,248 +369,190 @@ class TestPromptField:
             "default": False
         }
 
-        result = _prompt_field(field)
+        result = cmd_mod._prompt_field(field)
 
         assert result is True
         mock_confirm.assert_called_with("   Enable feature?", default=False)
 
+    @pytest.mark.parametrize("field,needle", [
+        pytest.param(
+            {"key": "api_key", "help": "Get your API key from settings page"},
+            "Get your API key",
+            id="help-text"),
+        pytest.param(
+            {"key": "api_key", "env_var": "MY_API_KEY"},
+            "MY_API_KEY",
+            id="env-var-hint"),
+    ])
     @patch('redgit.commands.integration.typer.echo')
-    def test_shows_help_text(self, mock_echo):
-        """Shows help text when available."""
+    def test_shows_hint(self, mock_echo, field, needle, cmd_mod):
+        """Shows the field's help text / env var hint when available."""
+        with patch('redgit.commands.integration.typer.prompt', return_value=""):
+            cmd_mod._prompt_field(field)
+
+        # Scan positional args directly; stringifying whole call objects
+        # formats the full repr per call.
+        assert any(
+            needle in arg
+            for args, _kwargs in mock_echo.call_args_list
+            for arg in args
+            if isinstance(arg, str)
+        )
+
+    def test_unknown_field_type(self, cmd_mod):
+        """Returns None for unknown field types."""
         field = {
-            "key": "api_key",
-            "help": "Get your API key from settings page"
+            "key": "unknown",
+            "type": "unknown_type"
         }
 
-        with patch('redgit.commands.integration.typer.prompt', return_value=""):
-            _prompt_field(field)
+        result = cmd_mod._prompt_field(field)
 
-        # Check that help text was shown
-        help_calls = [c for c in mock_echo.call_args_list if "Get your API key" in str(c)]
-        assert len(help_calls) > 0
+        assert result is None
 
-    @patch('redgit.commands.integration.typer.echo')
-    def test_shows_env_var_hint(self, mock_echo):
-        """Shows environment variable hint when available."""
-        field = {
-            "key": "api_key",
-            "env_var": "MY_API_KEY"
-        }
 
-        with patch('redgit.commands.integration.typer.prompt', return_value=""):
-            _prompt_field(field)
+# ==================== Tests for Template Generators ====================
 
-        # Check that env var hint was shown
-        env_calls = [c for c in mock_echo.call_args_list if "MY_API_KEY" in str(c)]
-        assert len(env_calls) > 0
+# The generators are pure functions of their arguments, so each template is
+# built (and compiled) once per module instead of once per assertion.
 
-    @patch('redgit.commands.integration.typer.prompt')
-    @patch('redgit.commands.integration.typer.echo')
-    def test_string_type_normalized_to_text(self, mock_echo, mock_prompt):
-        """String type is normalized to text type."""
-        mock_prompt.return_value = "value"
-        field = {
-            "key": "name",
-            "prompt": "Name",
-            "type": "string",  # Should be treated as "text"
-            "required": True
-        }
+@pytest.fixture(scope="module")
+def init_py_content(cmd_mod):
+    return cmd_mod._generate_init_py(
+        name="my_service",
+        class_name="MyServiceIntegration",
+        base_class="AnalysisBase",
+        type_name="analysis",
+        description="Test description"
+    )
 
-        result = _prompt_field(field)
 
-        assert result == "value"
+@pytest.fixture(scope="module")
+def commands_py_content(cmd_mod):
+    return cmd_mod._generate_commands_py(
+        name="my_service",
+        class_name="MyServiceIntegration"
+    )
 
-    def test_unknown_field_type(self):
-        """Returns None for unknown field types."""
-        field = {
-            "key": "unknown",
-            "type": "unknown_type"
-        }
 
-        result = _prompt_field(field)
+@pytest.fixture(scope="module")
+def install_schema(cmd_mod):
+    return cmd_mod._generate_install_schema(
+        name="my_service",
+        display_name="My Service",
+        description="Test description"
+    )
 
-        assert result is None
 
+@pytest.fixture(scope="module")
+def readme_content(cmd_mod):
+    return cmd_mod._generate_readme(
+        name="my_service",
+        class_name="MyServiceIntegration",
+        description="Test integration"
+    )
 
-# ==================== Tests for Template Generators ====================
 
 class TestGenerateInitPy:
     """Tests for _generate_init_py template generator."""
 
-    def test_generates_valid_python(self):
+    def test_generates_valid_python(self, init_py_content):
         """Generates syntactically valid Python code."""
-        content = _generate_init_py(
-            name="my_service",
-            class_name="MyServiceIntegration",
-            base_class="AnalysisBase",
-            type_name="analysis",
-            description="My custom service integration"
-        )
-
-        # Should compile without errors
-        compile(content, "<string>", "exec")
+        # Raises SyntaxError on bad code; ast.parse skips codegen that
+        # compile() would do on top of the same syntax check.
+        ast.parse(init_py_content)
 
-    def test_contains_class_definition(self):
+    def test_contains_class_definition(self, init_py_content):
         """Contains the integration class definition."""
-        content = _generate_init_py(
-            name="my_service",
-            class_name="MyServiceIntegration",
-            base_class="AnalysisBase",
-            type_name="analysis",
-            description="Test description"
-        )
-
-        assert "class MyServiceIntegration(AnalysisBase):" in content
-        assert 'name = "my_service"' in content
-        assert "IntegrationType.ANALYSIS" in content
+        assert "class MyServiceIntegration(AnalysisBase):" in init_py_content
+        assert 'name = "my_service"' in init_py_content
+        assert "IntegrationType.ANALYSIS" in init_py_content
 
-    def test_contains_required_methods(self):
+    def test_contains_required_methods(self, init_py_content):
         """Contains all required integration methods."""
-        content = _generate_init_py(
-            name="test",
-            class_name="TestIntegration",
-            base_class="TaskManagementBase",
-            type_name="task_management",
-            description="Test"
-        )
-
-        assert "def setup(self, config: dict):" in content
-        assert "def validate_connection(self) -> bool:" in content
-        assert "def after_install(cls, config: dict) -> dict:" in content
+        assert "def setup(self, config: dict):" in init_py_content
+        assert "def validate_connection(self) -> bool:" in init_py_content
+        assert "def after_install(cls, config: dict) -> dict:" in init_py_content
 
 
 class TestGenerateCommandsPy:
     """Tests for _generate_commands_py template generator."""
 
-    def test_generates_valid_python(self):
+    def test_generates_valid_python(self, commands_py_content):
         """Generates syntactically valid Python code."""
-        content = _generate_commands_py(
-            name="my_service",
-            class_name="MyServiceIntegration"
-        )
+        ast.parse(commands_py_content)
 
-        compile(content, "<string>", "exec")
-
-    def test_contains_typer_app(self):
+    def test_contains_typer_app(self, commands_py_content):
         """Contains Typer app definition."""
-        content = _generate_commands_py(
-            name="my_service",
-            class_name="MyServiceIntegration"
-        )
-
-        assert "my_service_app = typer.Typer(" in content
+        assert "my_service_app = typer.Typer(" in commands_py_content
 
-    def test_contains_commands(self):
+    def test_contains_commands(self, commands_py_content):
         """Contains expected CLI commands."""
-        content = _generate_commands_py(
-            name="my_service",
-            class_name="MyServiceIntegration"
-        )
-
-        assert "def status_cmd():" in content
-        assert "def test_cmd(" in content
-        assert "def analyze_cmd(" in content
+        assert "def status_cmd():" in commands_py_content
+        assert "def test_cmd(" in commands_py_content
+        assert "def analyze_cmd(" in commands_py_content
 
 
 class TestGenerateInstallSchema:
     """Tests for _generate_install_schema template generator."""
 
-    def test_returns_valid_dict(self):
+    def test_returns_valid_dict(self, install_schema):
         """Returns a valid dictionary."""
-        schema = _generate_install_schema(
-            name="my_service",
-            display_name="My Service",
-            description="Test description"
-        )
+        assert isinstance(install_schema, dict)
+        assert install_schema["name"] == "My Service"
+        assert install_schema["description"] == "Test description"
 
-        assert isinstance(schema, dict)
-        assert schema["name"] == "My Service"
-        assert schema["description"] == "Test description"
-
-    def test_contains_required_fields(self):
+    def test_contains_required_fields(self, install_schema):
         """Contains api_key as required field."""
-        schema = _generate_install_schema(
-            name="my_service",
-            display_name="My Service",
-            description="Test"
-        )
-
-        fields = schema["fields"]
+        fields = install_schema["fields"]
         api_key_field = next((f for f in fields if f["key"] == "api_key"), None)
 
         assert api_key_field is not None
         assert api_key_field["required"] is True
         assert api_key_field["type"] == "secret"
 
-    def test_env_var_uses_uppercase_name(self):
+    def test_env_var_uses_uppercase_name(self, install_schema):
         """Environment variable uses uppercase name."""
-        schema = _generate_install_schema(
-            name="my_service",
-            display_name="My Service",
-            description="Test"
-        )
-
-        api_key_field = schema["fields"][0]
+        api_key_field = install_schema["fields"][0]
         assert api_key_field["env_var"] == "MY_SERVICE_API_KEY"
 
 
 class TestGenerateReadme:
     """Tests for _generate_readme template generator."""
 
-    def test_contains_installation_section(self):
-        """Contains installation instructions."""
-        readme = _generate_readme(
-            name="my_service",
-            class_name="MyServiceIntegration",
-            description="Test integration"
-        )
-
-        assert "## Installation" in readme
-        assert "rg integration install my_service" in readme
-
-    def test_contains_configuration_section(self):
-        """Contains configuration examples."""
-        readme = _generate_readme(
-            name="my_service",
-            class_name="MyServiceIntegration",
-            description="Test"
-        )
-
-        assert "## Configuration" in readme
-        assert "my_service:" in readme
-
-    def test_contains_usage_section(self):
-        """Contains usage examples."""
-        readme = _generate_readme(
-            name="my_service",
-            class_name="MyServiceIntegration",
-            description="Test"
-        )
-
-        assert "## Usage" in readme
-        assert "rg my_service status" in readme
+    @pytest.mark.parametrize("needle", [
+        "## Installation",
+        "rg integration install my_service",
+        "## Configuration",
+        "my_service:",
+        "## Usage",
+        "rg my_service status",
+    ])
+    def test_contains_expected_sections(self, readme_content, needle):
+        """Contains installation, configuration and usage sections."""
+        assert needle in readme_content
 
 
 class TestGeneratePromptTemplates:
     """Tests for prompt template generators."""
 
-    def test_analyze_prompt_has_content_placeholder(self):
+    def test_analyze_prompt_has_content_placeholder(self, cmd_mod):
         """Analyze prompt has content placeholder."""
-        prompt = _generate_prompt_analyze()
+        prompt = cmd_mod._generate_prompt_analyze()
 
         assert "{content}" in prompt
         assert "Analyze" in prompt or "analyze" in prompt
 
-    def test_summarize_prompt_has_placeholders(self):
+    def test_summarize_prompt_has_placeholders(self, cmd_mod):
         """Summarize prompt has required placeholders."""
-        prompt = _generate_prompt_summarize()
+        prompt = cmd_mod._generate_prompt_summarize()
 
         assert "{content}" in prompt
         assert "{max_length}" in prompt
 
-    def test_custom_prompt_has_placeholders(self):
+    def test_custom_prompt_has_placeholders(self, cmd_mod):
         """Custom prompt has common placeholders."""
-        prompt = _generate_prompt_custom()
+        prompt = cmd_mod._generate_prompt_custom()
 
         assert "{input}" in prompt
         assert "{context}" in prompt
@@ -680,40 +565,36 @@ class TestListCmd:
     """Tests for list_cmd CLI command."""
 
     @patch('redgit.commands.integration._get_installed_integrations')
-    @patch('redgit.commands.integration.ConfigManager')
-    def test_no_integrations(self, mock_config_manager, mock_get_installed):
+    def test_no_integrations(self, mock_get_installed, cli_runner, cmd_mod):
         """Shows message when no integrations installed."""
         mock_get_installed.return_value = set()
-        mock_config_manager.return_value.load.return_value = {}
 
-        result = runner.invoke(integration_app, ["list"])
+        with fake_config():
+            result = cli_runner.invoke(cmd_mod.integration_app, ["list"])
 
         assert result.exit_code == 0
         assert "No integrations installed" in result.output
 
-    @patch('redgit.commands.integration.get_all_install_schemas')
-    @patch('redgit.commands.integration.get_integration_type')
-    @patch('redgit.commands.integration._get_installed_integrations')
-    @patch('redgit.commands.integration.ConfigManager')
-    def test_shows_installed_integrations(
-        self, mock_config_manager, mock_get_installed, mock_get_type, mock_get_schemas
-    ):
+    def test_shows_installed_integrations(self, cli_runner, cmd_mod):
         """Shows installed integrations grouped by type."""
-        mock_get_installed.return_value = {"jira", "slack"}
-        mock_config_manager.return_value.load.return_value = {
+        # patch.multiple installs the whole set in one target resolution
+        # instead of one start/stop pass per stacked decorator.
+        with patch.multiple(
+            'redgit.commands.integration',
+            _get_installed_integrations=MagicMock(return_value={"jira", "slack"}),
+            get_integration_type=MagicMock(side_effect=lambda n: (
+                IntegrationType.TASK_MANAGEMENT if n == "jira"
+                else IntegrationType.NOTIFICATION
+            )),
+            get_all_install_schemas=MagicMock(return_value={}),
+        ), fake_config({
             "integrations": {
                 "jira": {"enabled": True},
                 "slack": {"enabled": True}
             },
             "active": {"task_management": "jira"}
-        }
-        mock_get_type.side_effect = lambda n: (
-            IntegrationType.TASK_MANAGEMENT if n == "jira"
-            else IntegrationType.NOTIFICATION
-        )
-        mock_get_schemas.return_value = {}
-
-        result = runner.invoke(integration_app, ["list"])
+        }):
+            result = cli_runner.invoke(cmd_mod.integration_app, ["list"])
 
         assert result.exit_code == 0
         assert "jira" in result.output
@@ -724,9 +605,11 @@ class TestConfigCmd:
     """Tests for config_cmd CLI command."""
 
     @patch('redgit.commands.integration.configure_integration')
-    def test_calls_configure_integration(self, mock_configure):
+    def test_calls_configure_integration(self, mock_configure, cmd_mod):
         """Calls configure_integration with provided name."""
-        result = runner.invoke(integration_app, ["config", "jira"])
+        # Pure pass-through: call the callback directly instead of paying
+        # for a full CliRunner/Click context
+        cmd_mod.config_cmd("jira")
 
         mock_configure.assert_called_once_with("jira")
 
@@ -735,208 +618,191 @@ class TestAddCmd:
     """Tests for add_cmd CLI command."""
 
     @patch('redgit.commands.integration.get_builtin_integrations')
-    def test_integration_not_found(self, mock_get_builtin):
+    def test_integration_not_found(self, mock_get_builtin, cli_runner, cmd_mod):
         """Shows error for unknown integration."""
-        mock_get_builtin.return_value = {"jira": MagicMock(), "slack": MagicMock()}
+        mock_get_builtin.return_value = {"jira": _SENTINEL, "slack": _SENTINEL}
 
-        result = runner.invoke(integration_app, ["add", "unknown"])
+        result = cli_runner.invoke(cmd_mod.integration_app, ["add", "unknown"])
 
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    @patch('redgit.commands.integration.ConfigManager')
     @patch('redgit.commands.integration.get_builtin_integrations')
-    def test_already_enabled(self, mock_get_builtin, mock_config_manager):
+    def test_already_enabled(self, mock_get_builtin, cli_runner, cmd_mod):
         """Shows message when integration already enabled."""
-        mock_get_builtin.return_value = {"jira": MagicMock()}
-        mock_config_manager.return_value.load.return_value = {
-            "integrations": {"jira": {"enabled": True}}
-        }
+        mock_get_builtin.return_value = {"jira": _SENTINEL}
 
-        result = runner.invoke(integration_app, ["add", "jira"])
+        with fake_config(_JIRA_ENABLED):
+            result = cli_runner.invoke(cmd_mod.integration_app, ["add", "jira"])
 
         assert result.exit_code == 0
         assert "already enabled" in result.output
 
-    @patch('redgit.commands.integration.ConfigManager')
     @patch('redgit.commands.integration.get_builtin_integrations')
-    def test_enables_integration(self, mock_get_builtin, mock_config_manager):
+    def test_enables_integration(self, mock_get_builtin, cli_runner, cmd_mod):
         """Enables integration and saves config."""
-        mock_get_builtin.return_value = {"jira": MagicMock()}
-        mock_instance = mock_config_manager.return_value
-        mock_instance.load.return_value = {}
+        mock_get_builtin.return_value = {"jira": _SENTINEL}
 
-        result = runner.invoke(integration_app, ["add", "jira"])
+        with fake_config() as fake:
+            result = cli_runner.invoke(cmd_mod.integration_app, ["add", "jira"])
 
         assert result.exit_code == 0
         assert "enabled" in result.output
-        mock_instance.save.assert_called_once()
+        assert fake.saved is not None
 
 
 class TestRemoveCmd:
     """Tests for remove_cmd CLI command."""
 
-    @patch('redgit.commands.integration.ConfigManager')
-    def test_integration_not_configured(self, mock_config_manager):
+    def test_integration_not_configured(self, cli_runner, cmd_mod):
         """Shows error when integration not configured."""
-        mock_config_manager.return_value.load.return_value = {"integrations": {}}
-
-        result = runner.invoke(integration_app, ["remove", "jira"])
+        with fake_config(_NO_INTEGRATIONS):
+            result = cli_runner.invoke(cmd_mod.integration_app, ["remove", "jira"])
 
         assert result.exit_code == 1
         assert "not configured" in result.output
 
-    @patch('redgit.commands.integration.ConfigManager')
-    def test_disables_integration(self, mock_config_manager):
+    def test_disables_integration(self, cli_runner, cmd_mod):
         """Disables integration but preserves config."""
-        mock_instance = mock_config_manager.return_value
-        mock_instance.load.return_value = {
+        with fake_config({
             "integrations": {"jira": {"enabled": True, "api_key": "secret"}}
-        }
-
-        result = runner.invoke(integration_app, ["remove", "jira"])
+        }) as fake:
+            result = cli_runner.invoke(cmd_mod.integration_app, ["remove", "jira"])
 
         assert result.exit_code == 0
         assert "disabled" in result.output
 
         # Check that config was saved with enabled=False
-        saved_config = mock_instance.save.call_args[0][0]
-        assert saved_config["integrations"]["jira"]["enabled"] is False
+        assert fake.saved["integrations"]["jira"]["enabled"] is False
 
 
 class TestUseCmd:
     """Tests for use_cmd CLI command."""
 
     @patch('redgit.commands.integration.get_builtin_integrations')
-    def test_integration_not_found(self, mock_get_builtin):
+    def test_integration_not_found(self, mock_get_builtin, cli_runner, cmd_mod):
         """Shows error for unknown integration."""
-        mock_get_builtin.return_value = {"jira": MagicMock()}
+        mock_get_builtin.return_value = {"jira": _SENTINEL}
 
-        result = runner.invoke(integration_app, ["use", "unknown"])
+        result = cli_runner.invoke(cmd_mod.integration_app, ["use", "unknown"])
 
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    @patch('redgit.commands.integration.get_install_schema')
-    @patch('redgit.commands.integration.get_integration_type')
-    @patch('redgit.commands.integration.ConfigManager')
-    @patch('redgit.commands.integration.get_builtin_integrations')
-    def test_sets_integration_as_active(
-        self, mock_get_builtin, mock_config_manager, mock_get_type, mock_get_schema
-    ):
+    def test_sets_integration_as_active(self, cli_runner, cmd_mod):
         """Sets integration as active for its type."""
-        mock_get_builtin.return_value = {"jira": MagicMock()}
-        mock_get_type.return_value = IntegrationType.TASK_MANAGEMENT
-        mock_get_schema.return_value = {"fields": []}
-        mock_instance = mock_config_manager.return_value
-        mock_instance.load.return_value = {
+        with patch.multiple(
+            'redgit.commands.integration',
+            get_builtin_integrations=MagicMock(return_value=_INTEG_JIRA),
+            get_integration_type=MagicMock(return_value=IntegrationType.TASK_MANAGEMENT),
+            get_install_schema=MagicMock(return_value={"fields": []}),
+        ), fake_config({
             "integrations": {"jira": {"enabled": True}}
-        }
-
-        result = runner.invoke(integration_app, ["use", "jira"])
+        }) as fake:
+            result = cli_runner.invoke(cmd_mod.integration_app, ["use", "jira"])
 
         assert result.exit_code == 0
 
         # Check that active was set
-        saved_config = mock_instance.save.call_args[0][0]
-        assert saved_config["active"]["task_management"] == "jira"
+        assert fake.saved["active"]["task_management"] == "jira"
 
 
 class TestCreateCmd:
     """Tests for create_cmd CLI command."""
 
-    def test_creates_integration_directory(self, tmp_path, monkeypatch):
+    def test_creates_integration_directory(self, redgit_root, monkeypatch, cli_runner, cmd_mod):
         """Creates integration directory with all files."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create .redgit directory
-        (tmp_path / ".redgit").mkdir()
+        # The command's filesystem output is its intent to write these
+        # paths; recording write_text calls in-memory covers that without
+        # a real disk round-trip per generated file.
+        writes = {}
+        monkeypatch.setattr(
+            Path, "write_text",
+            lambda self, text, *a, **kw: writes.setdefault(str(self), text),
+        )
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: None)
 
         with patch('redgit.commands.integration.get_builtin_integrations', return_value={}):
             with patch('redgit.integrations.registry.refresh_integrations'):
-                result = runner.invoke(
-                    integration_app,
+                result = cli_runner.invoke(
+                    cmd_mod.integration_app,
                     ["create", "my_test"],
                     input="My Test\nTest description\n4\n"  # display name, description, type
                 )
 
         assert result.exit_code == 0
 
-        integration_dir = tmp_path / ".redgit" / "integrations" / "my_test"
-        assert integration_dir.exists()
-        assert (integration_dir / "__init__.py").exists()
-        assert (integration_dir / "commands.py").exists()
-        assert (integration_dir / "install_schema.json").exists()
-        assert (integration_dir / "README.md").exists()
-        assert (integration_dir / "prompts" / "analyze.txt").exists()
-
-    def test_rejects_invalid_name(self, tmp_path, monkeypatch):
-        """Rejects invalid integration names."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".redgit").mkdir()
-
-        result = runner.invoke(integration_app, ["create", "123-invalid"])
-
-        assert result.exit_code == 1
-        assert "Invalid name" in result.output
-
-    def test_rejects_existing_integration(self, tmp_path, monkeypatch):
-        """Rejects if integration already exists."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create existing integration directory
-        existing = tmp_path / ".redgit" / "integrations" / "existing"
-        existing.mkdir(parents=True)
-
-        result = runner.invoke(integration_app, ["create", "existing"])
-
-        assert result.exit_code == 1
-        assert "already exists" in result.output
-
-    def test_rejects_builtin_conflict(self, tmp_path, monkeypatch):
-        """Rejects names that conflict with builtins."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".redgit").mkdir()
+        integration_dir = Path(".redgit") / "integrations" / "my_test"
+        written = {Path(p) for p in writes}
+        assert integration_dir / "__init__.py" in written
+        assert integration_dir / "commands.py" in written
+        assert integration_dir / "install_schema.json" in written
+        assert integration_dir / "README.md" in written
+        assert integration_dir / "prompts" / "analyze.txt" in written
+
+    # The rejection paths call the command function directly; Click's
+    # invoke isolation adds nothing when the assertion is just the Exit
+    # code plus an output substring. The creation test above stays on
+    # runner.invoke for end-to-end coverage of the prompt flow.
+
+    @pytest.mark.parametrize("name,setup,builtins,expected", [
+        pytest.param("123-invalid", None, {}, "Invalid name",
+                     id="invalid-name"),
+        pytest.param(
+            "existing",
+            lambda root: (root / ".redgit" / "integrations" / "existing")
+            .mkdir(parents=True),
+            {}, "already exists",
+            id="already-exists"),
+        pytest.param("jira", None, {"jira": _SENTINEL}, "conflicts",
+                     id="builtin-conflict"),
+    ])
+    def test_rejects(self, name, setup, builtins, expected,
+                     redgit_root, capsys, cmd_mod):
+        """Rejects invalid, duplicate, and builtin-conflicting names."""
+        if setup is not None:
+            setup(redgit_root)
 
         with patch('redgit.commands.integration.get_builtin_integrations',
-                   return_value={"jira": MagicMock()}):
-            result = runner.invoke(integration_app, ["create", "jira"])
+                   return_value=builtins):
+            with pytest.raises(typer.Exit) as exc:
+                cmd_mod.create_cmd(name)
 
-        assert result.exit_code == 1
-        assert "conflicts" in result.output
+        assert exc.value.exit_code == 1
+        assert expected in capsys.readouterr().out
 
 
 class TestUpdateCmd:
     """Tests for update_cmd CLI command."""
 
-    @patch('redgit.commands.integration._get_installed_integrations')
-    @patch('redgit.commands.integration.ConfigManager')
-    def test_no_integrations_to_update(self, mock_config_manager, mock_get_installed):
+    def test_no_integrations_to_update(self, mocker, cli_runner, cmd_mod):
         """Shows message when no integrations installed."""
-        mock_get_installed.return_value = set()
-        mock_config_manager.return_value.load.return_value = {}
+        mocker.patch.object(
+            cmd_mod, '_get_installed_integrations', return_value=set())
 
-        result = runner.invoke(integration_app, ["update"])
+        with fake_config():
+            result = cli_runner.invoke(cmd_mod.integration_app, ["update"])
 
         assert "No integrations installed" in result.output
 
-    def test_updates_integration(self):
+    def test_updates_integration(self, cli_runner, cmd_mod):
         """Updates installed integration from tap."""
-        with patch('redgit.commands.integration._get_installed_integrations') as mock_get_installed:
-            with patch('redgit.commands.integration.ConfigManager') as mock_config_manager:
-                with patch('redgit.core.tap.find_item_in_taps') as mock_find_item:
-                    with patch('redgit.commands.tap.install_from_tap') as mock_install:
-                        mock_get_installed.return_value = {"my_integration"}
-                        mock_config_manager.return_value.load.return_value = {
-                            "integrations": {"my_integration": {"enabled": True}}
-                        }
-                        mock_find_item.return_value = {"name": "my_integration", "tap": "official"}
-                        mock_install.return_value = True
-
-                        result = runner.invoke(integration_app, ["update", "my_integration"])
-
-                        # Check output contains update message (skipped for local is fine too)
-                        assert result.exit_code == 0 or "skipped" in result.output
+        with patch.multiple(
+            'redgit.commands.integration',
+            _get_installed_integrations=MagicMock(
+                return_value={"my_integration"}),
+        ), patch(
+            'redgit.core.tap.find_item_in_taps',
+            return_value={"name": "my_integration", "tap": "official"},
+        ), patch(
+            'redgit.commands.tap.install_from_tap', return_value=True,
+        ), fake_config({
+            "integrations": {"my_integration": {"enabled": True}}
+        }):
+            result = cli_runner.invoke(cmd_mod.integration_app, ["update", "my_integration"])
+
+        # Check output contains update message (skipped for local is fine too)
+        assert result.exit_code == 0 or "skipped" in result.output
 
 
 # ==================== Tests for configure_integration ====================
@@ -944,73 +810,55 @@ class TestUpdateCmd:
 class TestConfigureIntegration:
     """Tests for configure_integration function."""
 
-    @patch('redgit.commands.integration.typer.Exit')
-    @patch('redgit.commands.integration.typer.echo')
-    @patch('redgit.commands.integration.typer.secho')
-    @patch('redgit.commands.integration.get_all_integrations')
-    def test_integration_not_found(self, mock_get_all, mock_secho, mock_echo, mock_exit):
+    def test_integration_not_found(self, mocker, cmd_mod):
         """Raises exit for unknown integration."""
-        mock_get_all.return_value = {"jira": MagicMock()}
-        mock_exit.side_effect = SystemExit(1)
+        mocker.patch.object(
+            cmd_mod, 'get_all_integrations', return_value=_INTEG_JIRA)
 
-        with pytest.raises(SystemExit):
-            configure_integration("unknown")
+        with pytest.raises(typer.Exit) as exc:
+            cmd_mod.configure_integration("unknown")
 
-        mock_exit.assert_called_with(1)
+        assert exc.value.exit_code == 1
 
-    @patch('redgit.commands.integration.ConfigManager')
-    @patch('redgit.commands.integration.get_install_schema')
-    @patch('redgit.commands.integration.get_all_integrations')
-    def test_enables_without_schema(self, mock_get_all, mock_get_schema, mock_config_manager):
+    def test_enables_without_schema(self, mocker, cmd_mod):
         """Enables integration when no schema is available."""
-        mock_get_all.return_value = {"simple": MagicMock()}
-        mock_get_schema.return_value = None
-        mock_instance = mock_config_manager.return_value
-        mock_instance.load.return_value = {}
-
-        configure_integration("simple")
-
-        saved_config = mock_instance.save.call_args[0][0]
-        assert saved_config["integrations"]["simple"]["enabled"] is True
-
-    @patch('redgit.commands.integration.get_integration_type')
-    @patch('redgit.commands.integration.get_integration_class')
-    @patch('redgit.commands.integration._prompt_field')
-    @patch('redgit.commands.integration.ConfigManager')
-    @patch('redgit.commands.integration.get_install_schema')
-    @patch('redgit.commands.integration.get_all_integrations')
-    def test_prompts_for_fields(
-        self, mock_get_all, mock_get_schema, mock_config_manager,
-        mock_prompt_field, mock_get_class, mock_get_type
-    ):
-        """Prompts for each field in schema."""
-        mock_get_all.return_value = {"jira": MagicMock()}
-        mock_get_schema.return_value = {
-            "name": "Jira",
-            "fields": [
-                {"key": "api_key", "required": True},
-                {"key": "base_url", "required": False}
-            ]
-        }
-        mock_prompt_field.side_effect = ["secret123", "https://jira.example.com"]
-        mock_instance = mock_config_manager.return_value
-        mock_instance.load.return_value = {}
-        mock_get_class.return_value = None
-        mock_get_type.return_value = IntegrationType.TASK_MANAGEMENT
+        mocker.patch.object(
+            cmd_mod, 'get_all_integrations', return_value=_INTEG_SIMPLE)
+        mocker.patch.object(cmd_mod, 'get_install_schema', return_value=None)
+
+        with fake_config() as fake:
+            cmd_mod.configure_integration("simple")
 
-        configure_integration("jira")
+        assert fake.saved["integrations"]["simple"]["enabled"] is True
+
+    def test_prompts_for_fields(self, mocker, cmd_mod):
+        """Prompts for each field in schema."""
+        mocker.patch.object(
+            cmd_mod, 'get_all_integrations', return_value=_INTEG_JIRA)
+        mocker.patch.object(
+            cmd_mod, 'get_install_schema', return_value=_JIRA_SCHEMA)
+        mock_prompt_field = mocker.patch.object(
+            cmd_mod, '_prompt_field',
+            side_effect=["secret123", "https://jira.example.com"])
+        mocker.patch.object(cmd_mod, 'get_integration_class', return_value=None)
+        mocker.patch.object(
+            cmd_mod, 'get_integration_type',
+            return_value=IntegrationType.TASK_MANAGEMENT)
+
+        with fake_config():
+            cmd_mod.configure_integration("jira")
 
         assert mock_prompt_field.call_count == 2
 
-    @patch('redgit.commands.integration.get_all_integrations')
-    def test_normalizes_hyphenated_name(self, mock_get_all):
+    def test_normalizes_hyphenated_name(self, mocker, cmd_mod):
         """Normalizes hyphenated names to underscores."""
-        mock_get_all.return_value = {"my_integration": MagicMock()}
+        mocker.patch.object(
+            cmd_mod, 'get_all_integrations',
+            return_value={"my_integration": _SENTINEL})
+        mocker.patch.object(cmd_mod, 'get_install_schema', return_value=None)
 
-        with patch('redgit.commands.integration.get_install_schema', return_value=None):
-            with patch('redgit.commands.integration.ConfigManager') as mock_cm:
-                mock_cm.return_value.load.return_value = {}
-                configure_integration("my-integration")
+        with fake_config():
+            cmd_mod.configure_integration("my-integration")
 
         # Should not raise error due to name normalization
 
@@ -1020,43 +868,18 @@ class TestConfigureIntegration:
 class TestIntegrationTypes:
     """Tests for INTEGRATION_TYPES constant."""
 
-    def test_has_all_types(self):
-        """Contains all expected integration types."""
-        assert "1" in INTEGRATION_TYPES
-        assert "2" in INTEGRATION_TYPES
-        assert "3" in INTEGRATION_TYPES
-        assert "4" in INTEGRATION_TYPES
-
-    def test_type_structure(self):
-        """Each type has correct structure."""
-        for key, value in INTEGRATION_TYPES.items():
-            assert len(value) == 3
-            type_name, base_class, label = value
-            assert isinstance(type_name, str)
-            assert isinstance(base_class, str)
-            assert isinstance(label, str)
-            assert "Base" in base_class
-
-    def test_task_management_type(self):
-        """Task management type is correct."""
-        type_name, base_class, label = INTEGRATION_TYPES["1"]
-        assert type_name == "task_management"
-        assert base_class == "TaskManagementBase"
-
-    def test_code_hosting_type(self):
-        """Code hosting type is correct."""
-        type_name, base_class, label = INTEGRATION_TYPES["2"]
-        assert type_name == "code_hosting"
-        assert base_class == "CodeHostingBase"
-
-    def test_notification_type(self):
-        """Notification type is correct."""
-        type_name, base_class, label = INTEGRATION_TYPES["3"]
-        assert type_name == "notification"
-        assert base_class == "NotificationBase"
-
-    def test_analysis_type(self):
-        """Analysis type is correct."""
-        type_name, base_class, label = INTEGRATION_TYPES["4"]
-        assert type_name == "analysis"
-        assert base_class == "AnalysisBase"
+    @pytest.mark.parametrize("index,type_name,base_class", [
+        (0, "task_management", "TaskManagementBase"),
+        (1, "code_hosting", "CodeHostingBase"),
+        (2, "notification", "NotificationBase"),
+        (3, "analysis", "AnalysisBase"),
+    ])
+    def test_type_entry(self, index, type_name, base_class, cmd_mod):
+        """Each menu position maps to the expected (name, base class, label)."""
+        tn, bc, label = cmd_mod.INTEGRATION_TYPES[index]
+        assert (tn, bc) == (type_name, base_class)
+        assert isinstance(label, str)
+
+    def test_no_unexpected_entries(self, cmd_mod):
+        """The constant holds exactly the four menu entries, in order."""
+        assert len(cmd_mod.INTEGRATION_TYPES) == 4
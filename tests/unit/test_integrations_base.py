@@ -2,6 +2,9 @@
 Unit tests for redgit.integrations.base module.
 """
 
+import dataclasses
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -28,29 +31,17 @@ from redgit.integrations.base import (
 class TestIntegrationType:
     """Tests for IntegrationType enum."""
 
-    def test_has_task_management_type(self):
-        """Test TASK_MANAGEMENT enum value."""
-        assert IntegrationType.TASK_MANAGEMENT.value == "task_management"
-
-    def test_has_code_hosting_type(self):
-        """Test CODE_HOSTING enum value."""
-        assert IntegrationType.CODE_HOSTING.value == "code_hosting"
-
-    def test_has_notification_type(self):
-        """Test NOTIFICATION enum value."""
-        assert IntegrationType.NOTIFICATION.value == "notification"
-
-    def test_has_analysis_type(self):
-        """Test ANALYSIS enum value."""
-        assert IntegrationType.ANALYSIS.value == "analysis"
-
-    def test_has_ci_cd_type(self):
-        """Test CI_CD enum value."""
-        assert IntegrationType.CI_CD.value == "ci_cd"
-
-    def test_has_code_quality_type(self):
-        """Test CODE_QUALITY enum value."""
-        assert IntegrationType.CODE_QUALITY.value == "code_quality"
+    @pytest.mark.parametrize("member,value", [
+        (IntegrationType.TASK_MANAGEMENT, "task_management"),
+        (IntegrationType.CODE_HOSTING, "code_hosting"),
+        (IntegrationType.NOTIFICATION, "notification"),
+        (IntegrationType.ANALYSIS, "analysis"),
+        (IntegrationType.CI_CD, "ci_cd"),
+        (IntegrationType.CODE_QUALITY, "code_quality"),
+    ])
+    def test_enum_value(self, member, value):
+        """Each member carries its snake_case value string."""
+        assert member.value == value
 
     def test_all_types_count(self):
         """Test that all expected types exist."""
@@ -312,17 +303,48 @@ class TestCoverageReportDataclass:
         assert report.coverage_change == 2.5
 
 
+class TestDataclassSlots:
+    """The shared dataclasses are slotted on Python 3.10+.
+
+    They are constructed in bulk (issue lists, pipeline runs), so the
+    per-instance __dict__ is deliberately dropped; these tests pin that
+    down so a stray field addition doesn't silently reintroduce it.
+    """
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass(slots=True) needs 3.10"
+    )
+    @pytest.mark.parametrize("cls", [
+        Issue, Sprint, PipelineRun, PipelineJob,
+        QualityReport, SecurityIssue, CoverageReport,
+    ], ids=lambda c: c.__name__)
+    def test_has_slots_and_no_instance_dict(self, cls):
+        """Slotted instances have no __dict__ and reject unknown attributes."""
+        kwargs = {
+            f.name: "x" for f in dataclasses.fields(cls)
+            if f.default is dataclasses.MISSING
+        }
+        instance = cls(**kwargs)
+
+        assert hasattr(cls, "__slots__")
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.not_a_field = "x"
+
+
+class _StubIntegration(IntegrationBase):
+    """Concrete IntegrationBase with the minimum to be instantiable."""
+
+    def setup(self, config):
+        pass
+
+
 class TestIntegrationBase:
     """Tests for IntegrationBase class."""
 
     def test_set_config_stores_config(self):
         """Test that set_config stores the config."""
-        # Create a concrete implementation for testing
-        class ConcreteIntegration(IntegrationBase):
-            def setup(self, config):
-                pass
-
-        integration = ConcreteIntegration()
+        integration = _StubIntegration()
         test_config = {"key": "value", "nested": {"a": 1}}
 
         integration.set_config(test_config)
@@ -332,35 +354,25 @@ class TestIntegrationBase:
 
     def test_init_sets_defaults(self):
         """Test that __init__ sets default values."""
-        class ConcreteIntegration(IntegrationBase):
-            def setup(self, config):
-                pass
-
-        integration = ConcreteIntegration()
+        integration = _StubIntegration()
 
         assert integration.enabled is False
         assert integration._config == {}
 
     def test_on_commit_does_nothing_by_default(self):
         """Test that on_commit is a no-op by default."""
-        class ConcreteIntegration(IntegrationBase):
-            def setup(self, config):
-                pass
-
-        integration = ConcreteIntegration()
+        integration = _StubIntegration()
         # Should not raise
         integration.on_commit({"files": []}, {"issue_key": "PROJ-1"})
 
     def test_get_notification_events_returns_class_events(self):
         """Test get_notification_events returns class-defined events."""
-        class ConcreteIntegration(IntegrationBase):
+        class EventfulIntegration(_StubIntegration):
             notification_events = {
                 "custom_event": {"description": "A custom event", "default": True}
             }
-            def setup(self, config):
-                pass
 
-        events = ConcreteIntegration.get_notification_events()
+        events = EventfulIntegration.get_notification_events()
 
         assert "custom_event" in events
         assert events["custom_event"]["default"] is True
@@ -375,6 +387,47 @@ class TestIntegrationBase:
         assert result["key"] == "value"
 
 
+# Stable sample input for the issue-content test; built once at import.
+_COMMIT_INFO = {
+    "commit_title": "feat: add new feature",
+    "commit_body": "Some description",
+    "files": ["a.py", "b.py"],
+}
+
+
+# Concrete subclasses are built once per module: each redefinition pays
+# metaclass + MRO + descriptor setup, and the stub methods never vary.
+
+@pytest.fixture(scope="module")
+def concrete_task_cls():
+    """Minimal concrete TaskManagementBase subclass."""
+    class ConcreteTask(TaskManagementBase):
+        def setup(self, config): pass
+        def get_my_active_issues(self): return []
+        def get_issue(self, key): return None
+        def create_issue(self, *args, **kwargs): return None
+        def add_comment(self, *args): return False
+        def transition_issue(self, *args): return False
+        def format_branch_name(self, *args): return ""
+
+    return ConcreteTask
+
+
+@pytest.fixture
+def concrete_task(concrete_task_cls):
+    return concrete_task_cls()
+
+
+@pytest.fixture(scope="module")
+def builtin_prompts(concrete_task_cls):
+    """The default built-in prompts, looked up once per module."""
+    task = concrete_task_cls()
+    return {
+        "issue_title": task._get_builtin_prompt("issue_title"),
+        "issue_description": task._get_builtin_prompt("issue_description"),
+    }
+
+
 class TestTaskManagementBase:
     """Tests for TaskManagementBase class."""
 
@@ -386,135 +439,50 @@ class TestTaskManagementBase:
         """Test default issue_language is 'en'."""
         assert TaskManagementBase.issue_language == "en"
 
-    def test_get_commit_prefix_returns_project_key(self):
+    def test_get_commit_prefix_returns_project_key(self, concrete_task_cls):
         """Test get_commit_prefix returns project_key."""
-        class ConcreteTask(TaskManagementBase):
+        class KeyedTask(concrete_task_cls):
             project_key = "PROJ"
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
+
+        task = KeyedTask()
         assert task.get_commit_prefix() == "PROJ"
 
-    def test_supports_sprints_returns_false_by_default(self):
+    def test_supports_sprints_returns_false_by_default(self, concrete_task):
         """Test supports_sprints returns False by default."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        assert task.supports_sprints() is False
+        assert concrete_task.supports_sprints() is False
 
-    def test_get_active_sprint_returns_none_by_default(self):
+    def test_get_active_sprint_returns_none_by_default(self, concrete_task):
         """Test get_active_sprint returns None by default."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        assert task.get_active_sprint() is None
+        assert concrete_task.get_active_sprint() is None
 
-    def test_get_sprint_issues_returns_empty_list(self):
+    def test_get_sprint_issues_returns_empty_list(self, concrete_task):
         """Test get_sprint_issues returns empty list by default."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        assert task.get_sprint_issues() == []
+        assert concrete_task.get_sprint_issues() == []
 
-    def test_add_issue_to_sprint_returns_false(self):
+    def test_add_issue_to_sprint_returns_false(self, concrete_task):
         """Test add_issue_to_sprint returns False by default."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        assert task.add_issue_to_sprint("PROJ-1", "sprint-1") is False
+        assert concrete_task.add_issue_to_sprint("PROJ-1", "sprint-1") is False
 
-    def test_get_builtin_prompt_returns_default_prompts(self):
+    def test_get_builtin_prompt_returns_default_prompts(self, builtin_prompts):
         """Test _get_builtin_prompt returns default prompts."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-
-        title_prompt = task._get_builtin_prompt("issue_title")
-        desc_prompt = task._get_builtin_prompt("issue_description")
+        title_prompt = builtin_prompts["issue_title"]
+        desc_prompt = builtin_prompts["issue_description"]
 
         assert title_prompt is not None
         assert "issue title" in title_prompt.lower()
         assert desc_prompt is not None
         assert "description" in desc_prompt.lower()
 
-    def test_get_builtin_prompt_returns_none_for_unknown(self):
+    def test_get_builtin_prompt_returns_none_for_unknown(self, concrete_task):
         """Test _get_builtin_prompt returns None for unknown prompt."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        result = task._get_builtin_prompt("unknown_prompt")
-        assert result is None
-
-    def test_generate_issue_content_returns_defaults_without_llm(self):
-        """Test generate_issue_content returns defaults when no LLM."""
-        class ConcreteTask(TaskManagementBase):
-            def setup(self, config): pass
-            def get_my_active_issues(self): return []
-            def get_issue(self, key): return None
-            def create_issue(self, *args, **kwargs): return None
-            def add_comment(self, *args): return False
-            def transition_issue(self, *args): return False
-            def format_branch_name(self, *args): return ""
-
-        task = ConcreteTask()
-        commit_info = {
-            "commit_title": "feat: add new feature",
-            "commit_body": "Some description",
-            "files": ["a.py", "b.py"]
-        }
+        assert concrete_task._get_builtin_prompt("unknown_prompt") is None
 
-        result = task.generate_issue_content(commit_info)
+    def test_generate_issue_content_returns_defaults_without_llm(self, concrete_task):
+        """Test generate_issue_content returns defaults when no LLM."""
+        result = concrete_task.generate_issue_content(_COMMIT_INFO)
 
-        assert result["title"] == "feat: add new feature"
-        assert result["description"] == "Some description"
+        assert result["title"] == _COMMIT_INFO["commit_title"]
+        assert result["description"] == _COMMIT_INFO["commit_body"]
 
 
 class TestCodeHostingBase:
@@ -535,6 +503,25 @@ class TestCodeHostingBase:
         assert hosting.get_default_branch() == "main"
 
 
+class _RecordingNotification(NotificationBase):
+    """Concrete NotificationBase that records the last sent message."""
+
+    def __init__(self):
+        super().__init__()
+        self.last_message = None
+
+    def setup(self, config): pass
+
+    def send_message(self, message, channel=None):
+        self.last_message = message
+        return True
+
+
+@pytest.fixture
+def notif():
+    return _RecordingNotification()
+
+
 class TestNotificationBase:
     """Tests for NotificationBase class."""
 
@@ -542,19 +529,8 @@ class TestNotificationBase:
         """Test that integration_type is NOTIFICATION."""
         assert NotificationBase.integration_type == IntegrationType.NOTIFICATION
 
-    def test_notify_formats_message(self):
+    def test_notify_formats_message(self, notif):
         """Test that notify formats message correctly."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         notif.notify(
             event_type="test",
             title="Test Title",
@@ -569,19 +545,8 @@ class TestNotificationBase:
         assert "Key: Value" in notif.last_message
         assert "https://example.com" in notif.last_message
 
-    def test_notify_commit_includes_branch(self):
+    def test_notify_commit_includes_branch(self, notif):
         """Test notify_commit includes branch in fields."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         notif.notify_commit(
             branch="feature/test",
             message="feat: add feature",
@@ -592,37 +557,15 @@ class TestNotificationBase:
         assert "feature/test" in notif.last_message
         assert "developer" in notif.last_message
 
-    def test_notify_branch_includes_issue_key(self):
+    def test_notify_branch_includes_issue_key(self, notif):
         """Test notify_branch includes issue key when provided."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         notif.notify_branch("feature/PROJ-123", issue_key="PROJ-123")
 
         assert "PROJ-123" in notif.last_message
         assert "feature/PROJ-123" in notif.last_message
 
-    def test_notify_pr_includes_url(self):
+    def test_notify_pr_includes_url(self, notif):
         """Test notify_pr includes URL."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         notif.notify_pr(
             title="Add feature",
             url="https://github.com/test/repo/pull/1",
@@ -633,19 +576,8 @@ class TestNotificationBase:
         assert "https://github.com/test/repo/pull/1" in notif.last_message
         assert "feature/test" in notif.last_message
 
-    def test_notify_task_formats_action(self):
+    def test_notify_task_formats_action(self, notif):
         """Test notify_task capitalizes action."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         notif.notify_task(
             action="created",
             issue_key="PROJ-123",
@@ -655,19 +587,8 @@ class TestNotificationBase:
         assert "Created" in notif.last_message
         assert "PROJ-123" in notif.last_message
 
-    def test_notify_alert_uses_level(self):
+    def test_notify_alert_uses_level(self, notif):
         """Test notify_alert accepts level parameter."""
-        class ConcreteNotification(NotificationBase):
-            def __init__(self):
-                super().__init__()
-                self.last_message = None
-
-            def setup(self, config): pass
-            def send_message(self, message, channel=None):
-                self.last_message = message
-                return True
-
-        notif = ConcreteNotification()
         result = notif.notify_alert(
             title="Warning",
             message="Something happened",
@@ -678,88 +599,76 @@ class TestNotificationBase:
         assert "Warning" in notif.last_message
 
 
-class TestCICDBase:
-    """Tests for CICDBase class."""
-
-    def test_integration_type_is_ci_cd(self):
-        """Test that integration_type is CI_CD."""
-        assert CICDBase.integration_type == IntegrationType.CI_CD
-
-    def test_get_pipeline_jobs_returns_empty_list(self):
-        """Test get_pipeline_jobs returns empty list by default."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
-            def list_pipelines(self, *args, **kwargs): return []
-            def cancel_pipeline(self, run_id): return False
-
-        cicd = ConcreteCICD()
-        assert cicd.get_pipeline_jobs("run-1") == []
+@pytest.fixture(scope="module")
+def concrete_cicd_cls():
+    """Minimal concrete CICDBase subclass."""
+    class ConcreteCICD(CICDBase):
+        def setup(self, config): pass
+        def trigger_pipeline(self, *args, **kwargs): return None
+        def get_pipeline_status(self, run_id): return None
+        def list_pipelines(self, *args, **kwargs): return []
+        def cancel_pipeline(self, run_id): return False
 
-    def test_retry_pipeline_returns_none(self):
-        """Test retry_pipeline returns None by default."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
-            def list_pipelines(self, *args, **kwargs): return []
-            def cancel_pipeline(self, run_id): return False
+    return ConcreteCICD
 
-        cicd = ConcreteCICD()
-        assert cicd.retry_pipeline("run-1") is None
 
-    def test_get_pipeline_logs_returns_none(self):
-        """Test get_pipeline_logs returns None by default."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
-            def list_pipelines(self, *args, **kwargs): return []
-            def cancel_pipeline(self, run_id): return False
+@pytest.fixture
+def concrete_cicd(concrete_cicd_cls):
+    return concrete_cicd_cls()
 
-        cicd = ConcreteCICD()
-        assert cicd.get_pipeline_logs("run-1") is None
 
-    def test_list_workflows_returns_empty_list(self):
-        """Test list_workflows returns empty list by default."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
-            def list_pipelines(self, *args, **kwargs): return []
-            def cancel_pipeline(self, run_id): return False
+class TestCICDBase:
+    """Tests for CICDBase class."""
 
-        cicd = ConcreteCICD()
-        assert cicd.list_workflows() == []
+    def test_integration_type_is_ci_cd(self):
+        """Test that integration_type is CI_CD."""
+        assert CICDBase.integration_type == IntegrationType.CI_CD
 
-    def test_get_latest_run_returns_first_from_list(self):
+    @pytest.mark.parametrize("method,args,expected", [
+        ("get_pipeline_jobs", ("run-1",), []),
+        ("retry_pipeline", ("run-1",), None),
+        ("get_pipeline_logs", ("run-1",), None),
+        ("list_workflows", (), []),
+    ])
+    def test_default_return_values(self, concrete_cicd, method, args, expected):
+        """Optional pipeline methods return their documented defaults."""
+        result = getattr(concrete_cicd, method)(*args)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == expected
+
+    def test_get_latest_run_returns_first_from_list(self, concrete_cicd_cls):
         """Test get_latest_run returns first item from list_pipelines."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
+        class OnePipelineCICD(concrete_cicd_cls):
             def list_pipelines(self, *args, **kwargs):
                 return [PipelineRun(id="run-1", name="CI", status="success")]
-            def cancel_pipeline(self, run_id): return False
 
-        cicd = ConcreteCICD()
+        cicd = OnePipelineCICD()
         result = cicd.get_latest_run()
 
         assert result is not None
         assert result.id == "run-1"
 
-    def test_get_latest_run_returns_none_when_empty(self):
+    def test_get_latest_run_returns_none_when_empty(self, concrete_cicd):
         """Test get_latest_run returns None when no pipelines."""
-        class ConcreteCICD(CICDBase):
-            def setup(self, config): pass
-            def trigger_pipeline(self, *args, **kwargs): return None
-            def get_pipeline_status(self, run_id): return None
-            def list_pipelines(self, *args, **kwargs): return []
-            def cancel_pipeline(self, run_id): return False
+        assert concrete_cicd.get_latest_run() is None
+
 
-        cicd = ConcreteCICD()
-        assert cicd.get_latest_run() is None
+@pytest.fixture(scope="module")
+def concrete_quality_cls():
+    """Minimal concrete CodeQualityBase subclass."""
+    class ConcreteQuality(CodeQualityBase):
+        def setup(self, config): pass
+        def get_quality_status(self, *args): return None
+        def get_project_metrics(self): return None
+
+    return ConcreteQuality
+
+
+@pytest.fixture
+def concrete_quality(concrete_quality_cls):
+    return concrete_quality_cls()
 
 
 class TestCodeQualityBase:
@@ -769,95 +678,24 @@ class TestCodeQualityBase:
         """Test that integration_type is CODE_QUALITY."""
         assert CodeQualityBase.integration_type == IntegrationType.CODE_QUALITY
 
-    def test_trigger_analysis_returns_false(self):
-        """Test trigger_analysis returns False by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.trigger_analysis() is False
-
-    def test_get_issues_returns_empty_list(self):
-        """Test get_issues returns empty list by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_issues() == []
-
-    def test_get_security_issues_returns_empty_list(self):
-        """Test get_security_issues returns empty list by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_security_issues() == []
-
-    def test_get_coverage_returns_none(self):
-        """Test get_coverage returns None by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_coverage() is None
-
-    def test_get_quality_gate_status_returns_none(self):
-        """Test get_quality_gate_status returns None by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_quality_gate_status() is None
-
-    def test_get_dependencies_returns_empty_list(self):
-        """Test get_dependencies returns empty list by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_dependencies() == []
-
-    def test_get_outdated_dependencies_returns_empty_list(self):
-        """Test get_outdated_dependencies returns empty list by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_outdated_dependencies() == []
-
-    def test_get_pr_analysis_returns_none(self):
-        """Test get_pr_analysis returns None by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.get_pr_analysis(123) is None
-
-    def test_compare_branches_returns_none(self):
-        """Test compare_branches returns None by default."""
-        class ConcreteQuality(CodeQualityBase):
-            def setup(self, config): pass
-            def get_quality_status(self, *args): return None
-            def get_project_metrics(self): return None
-
-        quality = ConcreteQuality()
-        assert quality.compare_branches("feature", "main") is None
+    @pytest.mark.parametrize("method,args,expected", [
+        ("trigger_analysis", (), False),
+        ("get_issues", (), []),
+        ("get_security_issues", (), []),
+        ("get_coverage", (), None),
+        ("get_quality_gate_status", (), None),
+        ("get_dependencies", (), []),
+        ("get_outdated_dependencies", (), []),
+        ("get_pr_analysis", (123,), None),
+        ("compare_branches", ("feature", "main"), None),
+    ])
+    def test_default_return_values(self, concrete_quality, method, args, expected):
+        """Optional quality methods return their documented defaults."""
+        result = getattr(concrete_quality, method)(*args)
+        if expected == []:
+            assert result == []
+        else:
+            assert result is expected
 
 
 class TestBackwardCompatibility:
@@ -306,33 +306,30 @@ class TestNotificationHelpers:
         assert isinstance(result, bool)
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
     def test_send_commit_notification_skips_when_disabled(
-        self, mock_cm, mock_get_notification
+        self, mock_get_notification
     ):
         """Test notification is skipped when disabled."""
         from redgit.commands.propose import _send_commit_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = False
-
+        # commit notifications are disabled by default
         _send_commit_notification({}, "main", "PROJ-123", 5)
 
         mock_get_notification.assert_not_called()
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
     def test_send_commit_notification_sends_message(
-        self, mock_cm, mock_get_notification
+        self, mock_get_notification
     ):
         """Test notification sends correct message."""
         from redgit.commands.propose import _send_commit_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = True
+        config = {"notifications": {"events": {"commit": True}}}
         mock_notification = MagicMock()
         mock_notification.enabled = True
         mock_get_notification.return_value = mock_notification
 
-        _send_commit_notification({}, "feature/test", "PROJ-123", 5)
+        _send_commit_notification(config, "feature/test", "PROJ-123", 5)
 
         mock_notification.send_message.assert_called_once()
         call_args = mock_notification.send_message.call_args[0][0]
@@ -929,24 +926,21 @@ class TestSendIssueCreatedNotification:
     """Tests for _send_issue_created_notification function."""
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
-    def test_skips_when_disabled(self, mock_cm, mock_get_notification):
+    def test_skips_when_disabled(self, mock_get_notification):
         """Test notification is skipped when disabled."""
         from redgit.commands.propose import _send_issue_created_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = False
+        config = {"notifications": {"enabled": False}}
 
-        _send_issue_created_notification({}, "PROJ-123", "Test Issue")
+        _send_issue_created_notification(config, "PROJ-123", "Test Issue")
 
         mock_get_notification.assert_not_called()
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
-    def test_sends_message_when_enabled(self, mock_cm, mock_get_notification):
+    def test_sends_message_when_enabled(self, mock_get_notification):
         """Test sends correct notification message."""
         from redgit.commands.propose import _send_issue_created_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = True
         mock_notification = MagicMock()
         mock_notification.enabled = True
         mock_get_notification.return_value = mock_notification
@@ -965,24 +959,21 @@ class TestSendSessionSummaryNotification:
     """Tests for _send_session_summary_notification function."""
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
-    def test_skips_when_disabled(self, mock_cm, mock_get_notification):
+    def test_skips_when_disabled(self, mock_get_notification):
         """Test notification is skipped when disabled."""
         from redgit.commands.propose import _send_session_summary_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = False
+        config = {"notifications": {"enabled": False}}
 
-        _send_session_summary_notification({}, 3, 2)
+        _send_session_summary_notification(config, 3, 2)
 
         mock_get_notification.assert_not_called()
 
     @patch('redgit.utils.notifications.get_notification')
-    @patch('redgit.utils.notifications.ConfigManager')
-    def test_sends_summary_message(self, mock_cm, mock_get_notification):
+    def test_sends_summary_message(self, mock_get_notification):
         """Test sends session summary notification."""
         from redgit.commands.propose import _send_session_summary_notification
 
-        mock_cm.return_value.is_notification_enabled.return_value = True
         mock_notification = MagicMock()
         mock_notification.enabled = True
         mock_get_notification.return_value = mock_notification
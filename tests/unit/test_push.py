@@ -24,24 +24,14 @@ from redgit.commands.push import (
 class TestGetUnpushedTags:
     """Tests for _get_unpushed_tags function."""
 
-    def test_returns_empty_list_when_no_tags(self, temp_git_repo, change_cwd):
+    def test_returns_empty_list_when_no_tags(self, temp_git_repo, gitops):
         """Test returns empty list when no local tags."""
-        import os
-        os.chdir(temp_git_repo)
-
-        from redgit.core.common.gitops import GitOps
-        gitops = GitOps()
 
         result = _get_unpushed_tags(gitops)
         assert result == []
 
-    def test_returns_local_tags_when_no_remote(self, temp_git_repo, change_cwd):
+    def test_returns_local_tags_when_no_remote(self, temp_git_repo, gitops):
         """Test returns local tags when remote doesn't exist."""
-        import os
-        os.chdir(temp_git_repo)
-
-        from redgit.core.common.gitops import GitOps
-        gitops = GitOps()
 
         # Create a local tag
         gitops.repo.git.tag("v1.0.0")
@@ -49,13 +39,8 @@ class TestGetUnpushedTags:
         result = _get_unpushed_tags(gitops)
         assert "v1.0.0" in result
 
-    def test_returns_list_type(self, temp_git_repo, change_cwd):
+    def test_returns_list_type(self, temp_git_repo, gitops):
         """Test always returns a list."""
-        import os
-        os.chdir(temp_git_repo)
-
-        from redgit.core.common.gitops import GitOps
-        gitops = GitOps()
 
         result = _get_unpushed_tags(gitops)
         assert isinstance(result, list)
@@ -157,40 +142,35 @@ class TestSendPushNotification:
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_push_notification({}, "main", ["PROJ-123"])
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_push_notification({}, "main", ["PROJ-123"])
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "main" in call_arg
-                assert "PROJ-123" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "main" in call_arg
+            assert "PROJ-123" in call_arg
 
     def test_skips_when_disabled(self):
         """Test skips notification when disabled."""
         mock_notification = MagicMock()
+        config = {"notifications": {"enabled": False}}
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = False
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_push_notification({}, "main", None)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_push_notification(config, "main", None)
 
-                mock_notification.send_message.assert_not_called()
+            mock_notification.send_message.assert_not_called()
 
     def test_handles_no_issues(self):
         """Test handles case with no issues."""
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_push_notification({}, "feature/test", None)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_push_notification({}, "feature/test", None)
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "feature/test" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "feature/test" in call_arg
 
     def test_handles_notification_error(self):
         """Test handles notification sending error gracefully."""
@@ -198,11 +178,9 @@ class TestSendPushNotification:
         mock_notification.enabled = True
         mock_notification.send_message.side_effect = Exception("Network error")
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                # Should not raise
-                _send_push_notification({}, "main", None)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            # Should not raise
+            _send_push_notification({}, "main", None)
 
 
 class TestSendPrNotification:
@@ -213,28 +191,24 @@ class TestSendPrNotification:
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_pr_notification({}, "feature/test", "https://github.com/pr/1", "PROJ-123")
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_pr_notification({}, "feature/test", "https://github.com/pr/1", "PROJ-123")
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "feature/test" in call_arg
-                assert "https://github.com/pr/1" in call_arg
-                assert "PROJ-123" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "feature/test" in call_arg
+            assert "https://github.com/pr/1" in call_arg
+            assert "PROJ-123" in call_arg
 
     def test_handles_no_issue_key(self):
         """Test handles PR without issue key."""
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_pr_notification({}, "feature/test", "https://github.com/pr/1", None)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_pr_notification({}, "feature/test", "https://github.com/pr/1", None)
 
-                mock_notification.send_message.assert_called_once()
+            mock_notification.send_message.assert_called_once()
 
 
 class TestSendCiNotification:
@@ -245,38 +219,34 @@ class TestSendCiNotification:
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_ci_notification({}, "main", "success", "https://ci.example.com/1")
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_ci_notification({}, "main", "success", "https://ci.example.com/1")
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "success" in call_arg.lower() or "completed" in call_arg.lower()
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "success" in call_arg.lower() or "completed" in call_arg.lower()
 
     def test_sends_failure_notification(self):
         """Test sends failure notification."""
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_ci_notification({}, "main", "failed", None)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_ci_notification({}, "main", "failed", None)
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "failed" in call_arg.lower()
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "failed" in call_arg.lower()
 
     def test_checks_correct_event(self):
         """Test checks ci_success or ci_failure event."""
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            with patch('redgit.utils.notifications.get_notification'):
-                mock_cm.return_value.is_notification_enabled.return_value = False
-                _send_ci_notification({}, "main", "success", None)
-                # Verify is_notification_enabled was called with ci_success
-                calls = [c[0][0] for c in mock_cm.return_value.is_notification_enabled.call_args_list]
-                assert "ci_success" in calls
+        mock_notification = MagicMock()
+        config = {"notifications": {"events": {"ci_success": False}}}
+
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            # ci_success disabled in config suppresses the notification
+            _send_ci_notification(config, "main", "success", None)
+            mock_notification.send_message.assert_not_called()
 
 
 class TestSendIssueCompletionNotification:
@@ -287,29 +257,25 @@ class TestSendIssueCompletionNotification:
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_issue_completion_notification({}, ["PROJ-123"])
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_issue_completion_notification({}, ["PROJ-123"])
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "PROJ-123" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "PROJ-123" in call_arg
 
     def test_sends_multiple_issues_notification(self):
         """Test notification for multiple issues."""
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_issue_completion_notification({}, ["PROJ-1", "PROJ-2", "PROJ-3"])
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_issue_completion_notification({}, ["PROJ-1", "PROJ-2", "PROJ-3"])
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "3" in call_arg
-                assert "PROJ-1" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "3" in call_arg
+            assert "PROJ-1" in call_arg
 
 
 class TestSendQualityFailedNotification:
@@ -320,15 +286,13 @@ class TestSendQualityFailedNotification:
         mock_notification = MagicMock()
         mock_notification.enabled = True
 
-        with patch('redgit.utils.notifications.ConfigManager') as mock_cm:
-            mock_cm.return_value.is_notification_enabled.return_value = True
-            with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
-                _send_quality_failed_notification({}, 65, 70)
+        with patch('redgit.utils.notifications.get_notification', return_value=mock_notification):
+            _send_quality_failed_notification({}, 65, 70)
 
-                mock_notification.send_message.assert_called_once()
-                call_arg = mock_notification.send_message.call_args[0][0]
-                assert "65" in call_arg
-                assert "70" in call_arg
+            mock_notification.send_message.assert_called_once()
+            call_arg = mock_notification.send_message.call_args[0][0]
+            assert "65" in call_arg
+            assert "70" in call_arg
 
 
 class TestSaveStatusToConfig: